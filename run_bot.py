@@ -15,12 +15,14 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(
 
 # Import our bot
 from src.integration.telegram.hybrid_native_bot import HybridNativeAI
+from src.core.logging_config import setup_queue_logging
 
 # Configure logging
 logging.basicConfig(
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
     level=logging.INFO
 )
+setup_queue_logging()
 
 logger = logging.getLogger(__name__)
 
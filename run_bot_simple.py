@@ -12,6 +12,7 @@ from langchain_openai import ChatOpenAI
 from dotenv import load_dotenv
 from src.domains.tools.calandar_tool import get_calendar_tools
 from src.domains.tools.email_tool import get_email_tools
+from src.core.logging_config import setup_queue_logging
 
 # Add the project root to the path so we can import our modules
 project_root = os.path.dirname(os.path.abspath(__file__))
@@ -22,6 +23,7 @@ logging.basicConfig(
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
     level=logging.INFO
 )
+setup_queue_logging()
 
 logger = logging.getLogger(__name__)
 
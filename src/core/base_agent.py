@@ -35,7 +35,7 @@ class BeliefType (Enum):
     KNOWLEDGE = "knowledge"
 
 
-@dataclass
+@dataclass(slots=True)
 class Belief:
     """
     Represents a belief in the BDI framework
@@ -51,7 +51,7 @@ class Belief:
         """Check if belief is still valid (not expired)"""
         return self.confidence > 0.1
 
-@dataclass
+@dataclass(slots=True)
 class Desire:
     """Represents a desire/goal in the BDI framework"""
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
@@ -75,7 +75,7 @@ class Desire:
         return len(valid_beliefs) > 0
 
 
-@dataclass
+@dataclass(slots=True)
 class Intention:
     """
     Represents an intention/plan in the BDI framework
@@ -0,0 +1,50 @@
+"""
+Logging setup for Native IQ
+Routes log records through a queue so handler I/O stays off the agent hot path
+"""
+
+import atexit
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+
+_listener: Optional[QueueListener] = None
+
+
+def setup_queue_logging(level: int = logging.INFO) -> QueueListener:
+    """
+    Move the root logger's handlers behind a QueueHandler.
+
+    Records are enqueued by the caller and written by a background
+    QueueListener thread. Call once from the application bootstrap, after
+    ``logging.basicConfig``. Repeated calls return the running listener.
+    """
+    global _listener
+
+    if _listener is not None:
+        return _listener
+
+    root = logging.getLogger()
+    handlers = list(root.handlers) or [logging.StreamHandler()]
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+
+    log_queue: queue.Queue = queue.Queue(-1)
+    root.addHandler(QueueHandler(log_queue))
+    root.setLevel(level)
+
+    _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    atexit.register(stop_queue_logging)
+
+    return _listener
+
+
+def stop_queue_logging() -> None:
+    """Flush pending records and stop the background listener"""
+    global _listener
+
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
@@ -463,7 +463,7 @@ class AnalyzerAgent(BaseAgent):
                     data_points=belief.content.get('total_patterns', 0)
                 )
                 self.business_insights[insight.insight_id] = insight
-                print(f"Created business insight: {insight.insight_id}")
+                logger.debug("Created business insight: %s", insight.insight_id)
         
         return analysis_results
     
@@ -503,7 +503,7 @@ class AnalyzerAgent(BaseAgent):
                         )
                         self.automation_opportunities[opportunity.opportunity_id] = opportunity
                         opportunities_created += 1
-                        print(f"Created automation opportunity: {opportunity.opportunity_id}")
+                        logger.debug("Created automation opportunity: %s", opportunity.opportunity_id)
                     
                     if hasattr(pattern, 'pattern_type') and ("meeting" in pattern.pattern_type or "schedule" in pattern.pattern_type):
                         opportunity = AutomationOpportunity(
@@ -517,7 +517,7 @@ class AnalyzerAgent(BaseAgent):
                         )
                         self.automation_opportunities[opportunity.opportunity_id] = opportunity
                         opportunities_created += 1
-                        print(f"Created automation opportunity: {opportunity.opportunity_id}")
+                        logger.debug("Created automation opportunity: %s", opportunity.opportunity_id)
         
         return {
             "opportunities_identified": len(self.automation_opportunities),
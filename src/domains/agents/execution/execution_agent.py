@@ -4,12 +4,20 @@ Executes approved automation decisions from Decision Agent
 """
 
 import asyncio
+import contextlib
+import json
 import logging
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from typing import Dict, Any, List, Optional
-from dataclasses import dataclass, field
+from typing import Dict, Any, List, Optional, Callable, Awaitable, NamedTuple, Tuple
+from dataclasses import dataclass, field, fields
 from enum import Enum
+from functools import lru_cache
+from itertools import islice
+from pathlib import Path
+from types import SimpleNamespace
 
+import numpy as np
 from langchain_core.tools import BaseTool
 from langchain_core.messages import HumanMessage
 from src.core.base_agent import BaseAgent, Belief, Desire, Intention, BeliefType
@@ -18,6 +26,69 @@ from src.domains.tools.email_tool import send_email
 
 logger = logging.getLogger(__name__)
 
+@lru_cache(maxsize=64)
+def _get_timezone(tz_name: str):
+    """Resolve a pytz timezone once per name"""
+    import pytz
+    return pytz.timezone(tz_name)
+
+def _normalize_decision(decision: Any) -> Any:
+    """Give dict and dataclass decisions the same attribute access"""
+    if hasattr(decision, 'decision_id'):
+        return decision
+    return SimpleNamespace(
+        decision_id=decision.get("decision_id"),
+        decision_type=decision.get("decision_type"),
+        opportunity_id=decision.get("opportunity_id")
+    )
+
+def _select_invoker(tool: Any) -> Callable[[Dict[str, Any]], Awaitable[Any]]:
+    """Pick the awaitable entry point for a tool, once per tool object"""
+    if hasattr(tool, 'ainvoke'):
+        return tool.ainvoke
+    if hasattr(tool, 'invoke'):
+        invoke = tool.invoke
+
+        async def _invoke_in_thread(parameters: Dict[str, Any]) -> Any:
+            return await asyncio.to_thread(invoke, parameters)
+
+        return _invoke_in_thread
+    return tool
+
+class TaskSpec(NamedTuple):
+    """Tool, permission and time-saved estimate for a rule-based task type"""
+    tool_name: str
+    read_only: bool
+    time_saved: float
+
+_TASK_SPECS: Dict[str, TaskSpec] = {
+    "send_email": TaskSpec("email_tool", False, 5.0),
+    "schedule_meeting": TaskSpec("calendar_tool", False, 15.0),
+    "create_file": TaskSpec("file_tool", False, 10.0),
+    "send_message": TaskSpec("messaging_tool", False, 3.0),
+    "create_report": TaskSpec("report_tool", False, 20.0),
+    "web_search": TaskSpec("search_tool", True, 8.0),
+    "list_drive_files": TaskSpec("list_drive_files", True, 3.0),
+    "download_drive_file": TaskSpec("download_drive_file", False, 7.0),
+    "upload_drive_file": TaskSpec("upload_drive_file", False, 10.0),
+    "get_drive_file_info": TaskSpec("get_drive_file_info", True, 2.0),
+    "get_upcoming_meetings": TaskSpec("get_upcoming_meetings", True, 5.0),
+}
+
+# Below this many beliefs the NumPy dispatch cost outweighs the scalar loop
+_VECTORIZED_LEARNING_THRESHOLD = 64
+
+# Permission prompts per task type; only the parameter slots are filled per call
+_PERMISSION_TEMPLATES = {
+    "get_upcoming_meetings": "🗓️ Should I check your calendar and show your schedule for {time_phrase}?",
+    "schedule_meeting": "📅 Should I schedule '{title}' for you?",
+    "send_email": "📧 Should I send an email to {recipient}?",
+    "list_drive_files": "📁 Should I list your Google Drive files?",
+    "download_drive_file": "⬇️ Should I download the file from Google Drive?",
+    "upload_drive_file": "⬆️ Should I upload the file to Google Drive?",
+}
+_DEFAULT_PERMISSION_TEMPLATE = "🤖 Should I execute: {user_message}?"
+
 class ExecutionStatus(Enum):
     PENDING = "pending"
     IN_PROGRESS = "in_progress"
@@ -25,7 +96,7 @@ class ExecutionStatus(Enum):
     FAILED = "failed"
     CANCELLED = "cancelled"
 
-@dataclass
+@dataclass(slots=True)
 class AutomationExecution:
     execution_id: str
     decision_id: str
@@ -53,14 +124,24 @@ class ExecutionAgent(BaseAgent):
     Execution Agent - Executes approved automation decisions
     """
 
-    def __init__(self, agent_id: str = "execution_001"):
+    def __init__(self, agent_id: str = "execution_001", max_executions_in_memory: int = 10000,
+                 data_dir: Path = None):
         super().__init__(agent_id, "execution", temperature=0.1)
 
-        self.executions: Dict[str, AutomationExecution] = {}
+        # Recent executions only; older ones are appended to the history file
+        self.executions: "OrderedDict[str, AutomationExecution]" = OrderedDict()
+        self.max_executions_in_memory = max_executions_in_memory
+        self.data_dir = data_dir or Path(__file__).resolve().parents[4] / "data"
+        self.execution_history_file = self.data_dir / "execution_history.jsonl"
+        self._archive_queue: Optional[asyncio.Queue] = None
+        self._archive_task: Optional[asyncio.Task] = None
+        self._in_progress_ids: set = set()
         self.execution_results: Dict[str, ExecutionResult] = {}
         
         # Tool system for actual task execution
         self.available_tools: Dict[str, BaseTool] = {}
+        # tool name -> (tool, awaitable entry point), re-resolved if available_tools changes underneath
+        self._tool_invokers: Dict[str, Tuple[Any, Callable[[Dict[str, Any]], Awaitable[Any]]]] = {}
         self.calendar_tools: Dict[str, Any] = {}  # Legacy support
         
         # Execution metrics
@@ -92,13 +173,24 @@ class ExecutionAgent(BaseAgent):
     def register_tool(self, tool_name: str, tool: BaseTool):
         """Register a tool for task execution"""
         self.available_tools[tool_name] = tool
+        self._tool_invokers[tool_name] = (tool, _select_invoker(tool))
         logger.info(f"Tool registered: {tool_name}")
     
     def register_tools(self, tools: Dict[str, BaseTool]):
         """Register multiple tools for task execution"""
         self.available_tools.update(tools)
+        for tool_name, tool in tools.items():
+            self._tool_invokers[tool_name] = (tool, _select_invoker(tool))
         logger.info(f"Registered {len(tools)} tools: {list(tools.keys())}")
     
+    def _invoker(self, tool_name: str) -> Callable[[Dict[str, Any]], Awaitable[Any]]:
+        """Awaitable entry point for a tool, also for tools placed in available_tools directly"""
+        tool = self.available_tools[tool_name]
+        entry = self._tool_invokers.get(tool_name)
+        if entry is None or entry[0] is not tool:
+            entry = self._tool_invokers[tool_name] = (tool, _select_invoker(tool))
+        return entry[1]
+
     def get_available_tools(self) -> List[str]:
         """Get list of available tool names"""
         return list(self.available_tools.keys())
@@ -227,6 +319,29 @@ class ExecutionAgent(BaseAgent):
                 "error": str(e)
             }
 
+    async def act_all(self, intentions: List[Intention], context: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Execute independent intentions concurrently so their tool I/O overlaps.
+
+        Counter updates in the execution paths happen on the event loop without an
+        intervening await, so concurrent ``act`` calls cannot interleave them.
+        """
+        results = await asyncio.gather(
+            *(self.act(intention, context) for intention in intentions),
+            return_exceptions=True
+        )
+
+        normalized = []
+        for intention, result in zip(intentions, results):
+            if isinstance(result, BaseException):
+                logger.error(f"Error executing intention {intention.id}: {result}")
+                result = {
+                    "success": False,
+                    "action_taken": False,
+                    "error": str(result)
+                }
+            normalized.append(result)
+        return normalized
+
     def _looks_like_status_query(self, user_message: str) -> bool:
         """Detect if user message is asking for status rather than requesting action"""
         status_indicators = [
@@ -419,7 +534,7 @@ For write operations (scheduling, sending emails), set requires_permission to tr
             response = await llm.ainvoke(messages)
             llm_response = response.content.strip()
             
-            logger.info(f"🤖 LLM analysis: {llm_response}")
+            logger.info("🤖 LLM analysis: %s", llm_response)
             
             # Parse LLM response
             try:
@@ -496,19 +611,11 @@ For write operations (scheduling, sending emails), set requires_permission to tr
                     }
             
             # Execute the tool
-            logger.info(f"🎯 LLM determined tool: {tool_name} with parameters: {parameters}")
-            
-            tool = self.available_tools[tool_name]
+            logger.info("🎯 LLM determined tool: %s with parameters: %s", tool_name, parameters)
             
-            # Execute tool based on its type
-            if hasattr(tool, 'ainvoke'):
-                result = await tool.ainvoke(parameters)
-            elif hasattr(tool, 'invoke'):
-                result = tool.invoke(parameters)
-            else:
-                result = await tool(parameters)
+            result = await self._invoker(tool_name)(parameters)
             
-            logger.info(f"✅ LLM-guided tool execution successful: {result}")
+            logger.info("✅ LLM-guided tool execution successful: %s", result)
             
             # Format response with LLM
             formatted_response = await self._llm_format_response(user_message, intent, result, tool_name)
@@ -573,32 +680,18 @@ Format this into a natural response:"""
     
     def _generate_permission_message(self, task_type: str, parameters: Dict[str, Any]) -> str:
         """Generate user-friendly permission request message"""
-        user_message = parameters.get("user_message", "")
+        template = _PERMISSION_TEMPLATES.get(task_type, _DEFAULT_PERMISSION_TEMPLATE)
         
         if task_type == "get_upcoming_meetings":
             days = parameters.get("days_ahead", 1)
             time_phrase = "tomorrow" if days == 1 else f"next {days} days"
-            return f"🗓️ Should I check your calendar and show your schedule for {time_phrase}?"
-        
-        elif task_type == "schedule_meeting":
-            title = parameters.get("title", "meeting")
-            return f"📅 Should I schedule '{title}' for you?"
+            return template.format(time_phrase=time_phrase)
         
-        elif task_type == "send_email":
-            recipient = parameters.get("recipient", "recipient")
-            return f"📧 Should I send an email to {recipient}?"
-        
-        elif task_type == "list_drive_files":
-            return f"📁 Should I list your Google Drive files?"
-        
-        elif task_type == "download_drive_file":
-            return f"⬇️ Should I download the file from Google Drive?"
-        
-        elif task_type == "upload_drive_file":
-            return f"⬆️ Should I upload the file to Google Drive?"
-        
-        else:
-            return f"🤖 Should I execute: {user_message}?"
+        return template.format(
+            title=parameters.get("title", "meeting"),
+            recipient=parameters.get("recipient", "recipient"),
+            user_message=parameters.get("user_message", "")
+        )
     
     def _determine_task_type(self, action_type: str, user_message: str) -> Optional[str]:
         """Determine the task type from intention and user message"""
@@ -640,10 +733,11 @@ Format this into a natural response:"""
     
     def _prepare_task_parameters(self, task_type: str, user_message: str, context: Dict[str, Any]) -> Dict[str, Any]:
         """Prepare parameters for task execution based on task type"""
+        now = datetime.now()
         base_params = {
             "user_message": user_message,
             "user": context.get("user", "User"),
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now.isoformat()
         }
         
         if task_type == "send_email":
@@ -657,7 +751,7 @@ Format this into a natural response:"""
             return {
                 **base_params,
                 "title": "Team Meeting",
-                "start_time": (datetime.now() + timedelta(days=1)).isoformat(),
+                "start_time": (now + timedelta(days=1)).isoformat(),
                 "duration_minutes": 30,
                 "attendees": ["team@company.com"],
                 "description": f"Meeting scheduled based on: {user_message}"
@@ -680,14 +774,14 @@ Format this into a natural response:"""
             return {
                 **base_params,
                 "title": "Automated Report",
-                "content": f"Report generated based on: {user_message}\n\nDate: {datetime.now().strftime('%Y-%m-%d')}\n\nThis report was automatically created by Native IQ.",
+                "content": f"Report generated based on: {user_message}\n\nDate: {now.year:04d}-{now.month:02d}-{now.day:02d}\n\nThis report was automatically created by Native IQ.",
                 "format": "text"
             }
         elif task_type == "create_file":
             return {
                 **base_params,
-                "filename": f"document_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt",
-                "content": f"Document created based on: {user_message}\n\nGenerated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+                "filename": f"document_{now.year:04d}{now.month:02d}{now.day:02d}_{now.hour:02d}{now.minute:02d}{now.second:02d}.txt",
+                "content": f"Document created based on: {user_message}\n\nGenerated: {now.year:04d}-{now.month:02d}-{now.day:02d} {now.hour:02d}:{now.minute:02d}:{now.second:02d}"
             }
         else:
             return base_params
@@ -722,10 +816,13 @@ Format this into a natural response:"""
     async def learn(self, beliefs: List[Belief], context: Dict[str, Any]) -> None:
         """Learn from execution results and improve performance"""
         try:
-            for belief in beliefs:
-                if belief.confidence > 0.7:
-                    if belief.type == BeliefType.KNOWLEDGE:
-                        await self._update_execution_knowledge(belief)
+            knowledge = [b for b in beliefs
+                         if b.confidence > 0.7 and b.type == BeliefType.KNOWLEDGE]
+            if len(knowledge) >= _VECTORIZED_LEARNING_THRESHOLD:
+                self._update_execution_knowledge_batch(knowledge)
+            else:
+                for belief in knowledge:
+                    await self._update_execution_knowledge(belief)
 
             # Learn from execution patterns
             if context.get('execution_feedback'):
@@ -753,9 +850,7 @@ Format this into a natural response:"""
                 updated_desires.append(execute_desire)
             
             # Check if we have active executions to monitor
-            active_executions = [e for e in self.executions.values() 
-                               if e.status == ExecutionStatus.IN_PROGRESS]
-            if active_executions:
+            if self._in_progress_ids:
                 monitor_desire = Desire(
                     id="monitor_active_executions",
                     goal="Monitor and track execution performance",
@@ -793,7 +888,6 @@ Format this into a natural response:"""
                                     "execution_type": plan.get("execution_type", "automation")
                                 }
                             )
-                            intention.action = "execute_automation"  # Add action attribute for existing act method
                             new_intentions.append(intention)
                 
                 elif desire.id == "monitor_active_executions":
@@ -804,7 +898,6 @@ Format this into a natural response:"""
                         action_type="monitor_executions",
                         parameters={}
                     )
-                    intention.action = "monitor_executions"  # Add action attribute for existing act method
                     new_intentions.append(intention)
             
             return new_intentions
@@ -816,20 +909,12 @@ Format this into a natural response:"""
     async def _process_approved_decision(self, decision: Any) -> Optional[Belief]:
         """Process an approved decision for execution"""
         try:
-            # Handle both dataclass and dict inputs
-            if hasattr(decision, 'decision_id'):
-                decision_id = decision.decision_id
-                decision_type = decision.decision_type
-                opportunity_id = decision.opportunity_id
-            else:
-                decision_id = decision.get("decision_id")
-                decision_type = decision.get("decision_type")
-                opportunity_id = decision.get("opportunity_id")
+            decision = _normalize_decision(decision)
 
-            if decision_type == "approve":
+            if decision.decision_type == "approve":
                 execution_plan = {
-                    "decision_id": decision_id,
-                    "opportunity_id": opportunity_id,
+                    "decision_id": decision.decision_id,
+                    "opportunity_id": decision.opportunity_id,
                     "execution_type": "automation",
                     "priority": "high",
                     "estimated_time_saved": 15
@@ -873,12 +958,9 @@ Format this into a natural response:"""
     async def _monitor_executions(self) -> Optional[Belief]:
         """Monitor ongoing executions"""
         try:
-            active_executions = [e for e in self.executions.values() 
-                               if e.status == ExecutionStatus.IN_PROGRESS]
-
-            if active_executions:
+            if self._in_progress_ids:
                 monitoring_data = {
-                    "active_executions": len(active_executions),
+                    "active_executions": len(self._in_progress_ids),
                     "total_executions": len(self.executions),
                     "success_rate": self.accuracy_rate,
                     "total_time_saved": self.total_time_saved
@@ -896,11 +978,94 @@ Format this into a natural response:"""
             logger.error(f"Error monitoring executions: {e}")
             return None
 
+    def _record_execution(self, execution: AutomationExecution) -> None:
+        """Track an execution, archiving the oldest finished ones once the window is full"""
+        self.executions[execution.execution_id] = execution
+        if execution.status == ExecutionStatus.IN_PROGRESS:
+            self._in_progress_ids.add(execution.execution_id)
+        # Running executions sit outside the cap and are only archived once finished
+        excess = len(self.executions) - len(self._in_progress_ids) - self.max_executions_in_memory
+        if excess <= 0:
+            return
+        evict_ids = list(islice(
+            (eid for eid in self.executions if eid not in self._in_progress_ids), excess
+        ))
+        for evicted_id in evict_ids:
+            self._archive_execution(self.executions.pop(evicted_id))
+
+    def _complete_execution(self, execution: AutomationExecution) -> None:
+        """Mark an execution completed and drop it from the active set"""
+        execution.status = ExecutionStatus.COMPLETED
+        execution.end_time = datetime.now()
+        self._in_progress_ids.discard(execution.execution_id)
+
+    def _fail_execution(self, execution_id: str) -> None:
+        """Mark a recorded execution failed and drop it from the active set"""
+        execution = self.executions.get(execution_id)
+        if execution is not None and execution.status == ExecutionStatus.IN_PROGRESS:
+            execution.status = ExecutionStatus.FAILED
+            execution.end_time = datetime.now()
+        self._in_progress_ids.discard(execution_id)
+
+    def _archive_execution(self, execution: AutomationExecution) -> None:
+        """Queue an evicted execution for the background history writer"""
+        if self._archive_queue is None:
+            self._archive_queue = asyncio.Queue()
+        if self._archive_task is None or self._archive_task.done():
+            self._archive_task = asyncio.get_running_loop().create_task(self._drain_execution_archive())
+        self._archive_queue.put_nowait(self._serialize_execution(execution))
+
+    async def _drain_execution_archive(self) -> None:
+        """Write queued executions to the history file in batches"""
+        while True:
+            records = [await self._archive_queue.get()]
+            while not self._archive_queue.empty():
+                records.append(self._archive_queue.get_nowait())
+            try:
+                await asyncio.to_thread(self._append_execution_history, records)
+            except Exception as e:
+                logger.error(f"Error archiving executions: {e}")
+            finally:
+                for _ in records:
+                    self._archive_queue.task_done()
+
+    async def aclose(self) -> None:
+        """Flush queued executions to the history file and stop the background writer"""
+        if self._archive_task is None:
+            return
+        if not self._archive_task.done():
+            await self._archive_queue.join()
+            self._archive_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._archive_task
+        self._archive_task = None
+        records = []
+        while not self._archive_queue.empty():
+            records.append(self._archive_queue.get_nowait())
+        if records:
+            await asyncio.to_thread(self._append_execution_history, records)
+
+    def _append_execution_history(self, records: List[Dict[str, Any]]) -> None:
+        """Append serialized executions to the JSON Lines history file"""
+        self.data_dir.mkdir(parents=True, exist_ok=True)
+        with open(self.execution_history_file, 'a') as f:
+            for record in records:
+                f.write(json.dumps(record, default=str) + "\n")
+
+    @staticmethod
+    def _serialize_execution(execution: AutomationExecution) -> Dict[str, Any]:
+        """Convert an execution to a JSON-friendly dict"""
+        record = {f.name: getattr(execution, f.name) for f in fields(execution)}
+        record["status"] = execution.status.value
+        for key in ("start_time", "end_time", "created_at"):
+            if record[key] is not None:
+                record[key] = record[key].isoformat()
+        return record
+
     async def _execute_automation(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
         """Execute a general automation task"""
+        execution_id = f"exec_{datetime.now().timestamp()}"
         try:
-            execution_id = f"exec_{datetime.now().timestamp()}"
-            
             execution = AutomationExecution(
                 execution_id=execution_id,
                 decision_id=parameters.get("decision_id", "unknown"),
@@ -909,15 +1074,11 @@ Format this into a natural response:"""
                 start_time=datetime.now()
             )
 
-            self.executions[execution_id] = execution
+            self._record_execution(execution)
             self.total_executions += 1
 
-            # Simulate execution (replace with real automation logic)
-            await asyncio.sleep(0.1)  # Simulate processing time
-
             # Mark as completed
-            execution.status = ExecutionStatus.COMPLETED
-            execution.end_time = datetime.now()
+            self._complete_execution(execution)
             execution.success_rate = 0.95
             execution.time_saved = 10.0
 
@@ -935,13 +1096,13 @@ Format this into a natural response:"""
 
         except Exception as e:
             logger.error(f"Error executing automation: {e}")
+            self._fail_execution(execution_id)
             return {"success": False, "error": str(e)}
 
     async def _execute_meeting_scheduling(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
         """Execute meeting scheduling automation"""
+        execution_id = f"meeting_exec_{datetime.now().timestamp()}"
         try:
-            execution_id = f"meeting_exec_{datetime.now().timestamp()}"
-
             execution = AutomationExecution(
                 execution_id=execution_id,
                 decision_id=parameters.get("decision_id", "unknown"),
@@ -950,7 +1111,7 @@ Format this into a natural response:"""
                 start_time=datetime.now()
             )
 
-            self.executions[execution_id] = execution
+            self._record_execution(execution)
             self.total_executions += 1
 
             # Use calendar tools if available
@@ -971,8 +1132,7 @@ Format this into a natural response:"""
                     # Continue with simulation
 
             # Mark as completed
-            execution.status = ExecutionStatus.COMPLETED
-            execution.end_time = datetime.now()
+            self._complete_execution(execution)
             execution.success_rate = 0.98
             execution.time_saved = 15.0
 
@@ -990,13 +1150,13 @@ Format this into a natural response:"""
 
         except Exception as e:
             logger.error(f"Error executing meeting scheduling: {e}")
+            self._fail_execution(execution_id)
             return {"success": False, "error": str(e)}
 
     async def _execute_automated_response(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
         """Execute automated response generation"""
+        execution_id = f"response_exec_{datetime.now().timestamp()}"
         try:
-            execution_id = f"response_exec_{datetime.now().timestamp()}"
-
             execution = AutomationExecution(
                 execution_id=execution_id,
                 decision_id=parameters.get("decision_id", "unknown"),
@@ -1005,7 +1165,7 @@ Format this into a natural response:"""
                 start_time=datetime.now()
             )
 
-            self.executions[execution_id] = execution
+            self._record_execution(execution)
             self.total_executions += 1
 
             # Simulate response generation
@@ -1017,8 +1177,7 @@ Format this into a natural response:"""
             }
 
             # Mark as completed
-            execution.status = ExecutionStatus.COMPLETED
-            execution.end_time = datetime.now()
+            self._complete_execution(execution)
             execution.success_rate = 0.92
             execution.time_saved = 5.0
 
@@ -1036,6 +1195,7 @@ Format this into a natural response:"""
 
         except Exception as e:
             logger.error(f"Error executing automated response: {e}")
+            self._fail_execution(execution_id)
             return {"success": False, "error": str(e)}
 
     async def _execute_task_with_tools(self, task_type: str, parameters: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
@@ -1044,27 +1204,13 @@ Format this into a natural response:"""
             execution_id = f"tool_exec_{datetime.now().timestamp()}"
             logger.info(f"🚀 Executing task with tools: {task_type}")
             
-            # Map task types to required tools
-            tool_mapping = {
-                "send_email": "email_tool",
-                "schedule_meeting": "calendar_tool", 
-                "create_file": "file_tool",
-                "send_message": "messaging_tool",
-                "create_report": "report_tool",
-                "web_search": "search_tool",
-                "list_drive_files": "list_drive_files",
-                "download_drive_file": "download_drive_file",
-                "upload_drive_file": "upload_drive_file",
-                "get_drive_file_info": "get_drive_file_info",
-                "get_upcoming_meetings": "get_upcoming_meetings",
-            }
-            
-            required_tool = tool_mapping.get(task_type)
-            if not required_tool:
+            spec = _TASK_SPECS.get(task_type)
+            if spec is None:
                 return {
                     "success": False,
                     "error": f"Unknown task type: {task_type}"
                 }
+            required_tool = spec.tool_name
             
             # Check if required tool is available
             if not self.has_tool(required_tool):
@@ -1077,20 +1223,14 @@ Format this into a natural response:"""
                 }
             
             # Get the tool and execute
-            tool = self.available_tools[required_tool]
+            invoke_tool = self._invoker(required_tool)
             logger.info(f"🔧 Using tool: {required_tool}")
             
-            # Auto-execute read-only tasks, ask permission for write operations
-            read_only_tasks = [
-                "get_upcoming_meetings", "list_drive_files", "get_drive_file_info", 
-                "web_search", "find_free_slots"
-            ]
-            
             permission_context = context.get("permission_context", {})
             user_confirmed = permission_context.get("user_confirmed", False)
             
-            # Skip permission for read-only tasks
-            if task_type not in read_only_tasks and not user_confirmed:
+            # Auto-execute read-only tasks, ask permission for write operations
+            if not spec.read_only and not user_confirmed:
                 # Return permission request for write operations
                 return {
                     "success": False,
@@ -1104,7 +1244,7 @@ Format this into a natural response:"""
             
             # Execute tool with parameters (auto for read-only, or if user confirmed)
             try:
-                logger.info(f"🔧 About to execute tool '{required_tool}' with parameters: {parameters}")
+                logger.info("🔧 About to execute tool '%s' with parameters: %s", required_tool, parameters)
                 
                 # Special handling for calendar tools
                 if task_type == "get_upcoming_meetings":
@@ -1113,48 +1253,23 @@ Format this into a natural response:"""
                         from src.domains.tools.calandar_tool import get_upcoming_meetings
                         days_ahead = parameters.get("days_ahead", 1)
                         result = await get_upcoming_meetings(days_ahead=days_ahead)
-                        logger.info(f"✅ Calendar tool executed directly: {result}")
+                        logger.info("✅ Calendar tool executed directly: %s", result)
                     except Exception as calendar_error:
                         logger.error(f"Direct calendar tool call failed: {calendar_error}")
                         # Fallback to registered tool
-                        if hasattr(tool, 'ainvoke'):
-                            result = await tool.ainvoke(parameters)
-                        elif hasattr(tool, 'invoke'):
-                            result = tool.invoke(parameters)
-                        else:
-                            result = await tool(parameters)
+                        result = await invoke_tool(parameters)
                 else:
                     # Normal tool execution for other tools
-                    if hasattr(tool, 'ainvoke'):
-                        # Async tool execution
-                        result = await tool.ainvoke(parameters)
-                    elif hasattr(tool, 'invoke'):
-                        # Sync tool execution
-                        result = tool.invoke(parameters)
-                    else:
-                        # Direct call
-                        result = await tool(parameters)
+                    result = await invoke_tool(parameters)
                 
-                logger.info(f"✅ Tool execution successful: {result}")
+                logger.info("✅ Tool execution successful: %s", result)
                 
                 # Track execution metrics
                 self.total_executions += 1
                 self.successful_executions += 1
                 
                 # Estimate time saved based on task type
-                time_saved_mapping = {
-                    "send_email": 5.0,
-                    "schedule_meeting": 15.0,
-                    "create_file": 10.0,
-                    "create_report": 20.0,
-                    "send_message": 3.0,
-                    "web_search": 8.0,
-                    "list_drive_files": 3.0,
-                    "download_drive_file": 7.0,
-                    "upload_drive_file": 10.0,
-                    "get_drive_file_info": 2.0
-                }
-                time_saved = time_saved_mapping.get(task_type, 5.0)
+                time_saved = spec.time_saved
                 self.total_time_saved += time_saved
                 
                 return {
@@ -1204,6 +1319,27 @@ Format this into a natural response:"""
         except Exception as e:
             logger.error(f"Error updating execution knowledge: {e}")
 
+    def _update_execution_knowledge_batch(self, beliefs: List[Belief]) -> None:
+        """Apply the accuracy EWMA and time-saved totals for a batch of beliefs at once"""
+        try:
+            rates = np.fromiter(
+                (b.content["success_rate"] for b in beliefs if "success_rate" in b.content),
+                dtype=float
+            )
+            if rates.size:
+                # Closed form of repeatedly applying acc = 0.8 * acc + 0.2 * rate
+                weights = 0.2 * np.power(0.8, np.arange(rates.size - 1, -1, -1))
+                self.accuracy_rate = float(0.8 ** rates.size * self.accuracy_rate + weights @ rates)
+
+            time_saved = np.fromiter(
+                (b.content["time_saved"] for b in beliefs if "time_saved" in b.content),
+                dtype=float
+            )
+            self.total_time_saved += float(time_saved.sum())
+
+        except Exception as e:
+            logger.error(f"Error updating execution knowledge: {e}")
+
     def _normalize_meeting_time(self, parameters: dict, user_tz, now) -> tuple[dict, list[str]]:
         """Validate and normalize meeting time parameters"""
         from datetime import datetime, timedelta
@@ -1257,14 +1393,13 @@ Format this into a natural response:"""
         """Format datetime for user-friendly display with proper timezone handling"""
         try:
             from dateutil import parser as dateparser
-            import pytz
             
             dt = dateparser.isoparse(iso_str)
             
             # Convert to user timezone if needed
             if user_tz_str:
                 try:
-                    user_tz = pytz.timezone(user_tz_str)
+                    user_tz = _get_timezone(user_tz_str)
                     if dt.tzinfo is None:
                         dt = user_tz.localize(dt)
                     else:
@@ -1273,12 +1408,11 @@ Format this into a natural response:"""
                     # Fallback: keep original dt
                     pass
             
-            # Format components
-            day = dt.strftime("%a, %d %b %Y")
-            time = dt.strftime("%I:%M %p").lstrip("0")
+            # Format all components with a single strftime call
+            day, time, offset = dt.strftime("%a, %d %b %Y|%I:%M %p|%z").split("|")
+            time = time.lstrip("0")
             
             # Format timezone offset
-            offset = dt.strftime("%z")
             if offset and len(offset) == 5:
                 offset_fmt = f"{offset[:3]}:{offset[3:]}"
             else:
@@ -1318,7 +1452,6 @@ Format this into a natural response:"""
             "successful_executions": self.successful_executions,
             "success_rate": self.successful_executions / max(1, self.total_executions),
             "total_time_saved": self.total_time_saved,
-            "active_executions": len([e for e in self.executions.values() 
-                                    if e.status == ExecutionStatus.IN_PROGRESS]),
+            "active_executions": len(self._in_progress_ids),
             "accuracy_rate": self.accuracy_rate
         }
\ No newline at end of file
@@ -4,11 +4,18 @@ Learns complete communication patterns for automation
 """
 
 import asyncio
+import hashlib
 import json
+import logging
 import re
+import sys
+from collections import OrderedDict
+from collections.abc import Mapping
 from datetime import datetime, timedelta
-from typing import Dict, Any, List, Optional, Set
+from typing import Dict, Any, List, Optional, Set, Tuple, FrozenSet
 from dataclasses import dataclass, field
+from functools import lru_cache
+from types import MappingProxyType
 
 from src.core.base_agent import (
     BaseAgent, 
@@ -18,10 +25,239 @@ from src.core.base_agent import (
     BeliefType,
     AgentStatus
 )
+import numpy as np
 from langchain_core.messages import BaseMessage
 
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
 
-@dataclass
+logger = logging.getLogger(__name__)
+
+
+# keyword dictionaries used by the text analyzers
+FORMAL_INDICATORS = ["dear", "sincerely", "regards", "please find attached", "please find the attached", "please find the following", "please find the enclosed", "i've attached it to this"]
+CASUAL_INDICATORS = ["hey", "thanks", "cool", "awesome", "hi", "hello", "hi there", "hello there"]
+URGENT_INDICATORS = ["urgent", "asap", "immediately", "emergency", "critical"]
+BUSINESS_KEYWORDS = [
+    "meeting", "project", "deadline", "budget", "proposal", 
+    "contract", "invoice", "payment", "delivery", "schedule",
+    "relationship", "contact", "communication", "interaction", "collaboration",
+    "decision", "approval", "rejection", "acceptance", "decline", "yes", "no",
+    "agree", "disagree", "proceed", "cancel", "postpone", "support", "oppose", "endorse", "withdraw", "defer"
+]
+POSITIVE_WORDS = ["great", "excellent", "good", "pleased", "happy"]
+NEGATIVE_WORDS = ["problem", "issue", "concern", "disappointed", "frustrated"]
+DECISION_INDICATORS = [
+    "approve", "reject", "accept", "decline", "yes", "no",
+    "agree", "disagree", "proceed", "cancel", "postpone",
+    "support", "oppose", "endorse", "withdraw", "defer"
+]  # this is for simple decision making by keywords
+AUTOMATION_SIGNALS = [
+    "same as last time", "usual response", "standard procedure",
+    "as always", "like before", "typical", "routine", 
+]
+TEMPLATE_INDICATORS = [
+    "thank you for", "we will", "please find", "as requested",
+    "i am writing to", "following up on"
+]
+
+
+# contact and template-variable extraction
+_FULL_NAME_PATTERN = r'\b[A-Z][a-z]+ [A-Z][a-z]+\b'  # First Last
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b')
+_NAME_RE = re.compile(rf'{_FULL_NAME_PATTERN}|\b[A-Z]\. [A-Z][a-z]+\b')  # First Last or F. Last
+_FULL_NAME_RE = re.compile(_FULL_NAME_PATTERN)
+_DATE_RE = re.compile(r'\d{1,2}/\d{1,2}/\d{4}')
+_AMOUNT_RE = re.compile(r'\$\d+')
+
+# category -> distinct keywords of that category found in a message (read-only, shared through the scan caches)
+KeywordScan = Mapping[str, FrozenSet[str]]
+
+KEYWORD_CATEGORIES: Dict[str, List[str]] = {
+    "formal": FORMAL_INDICATORS,
+    "casual": CASUAL_INDICATORS,
+    "urgent": URGENT_INDICATORS,
+    "topic": BUSINESS_KEYWORDS,
+    "positive": POSITIVE_WORDS,
+    "negative": NEGATIVE_WORDS,
+    "decision": DECISION_INDICATORS,
+    "automation": AUTOMATION_SIGNALS,
+    "template": TEMPLATE_INDICATORS,
+}
+
+
+def _keyword_regex(keywords: List[str]) -> "re.Pattern[str]":
+    """Compile a keyword list into one case-insensitive whole-word alternation"""
+    alternation = "|".join(map(re.escape, sorted(keywords, key=len, reverse=True)))
+    return re.compile(rf"\b(?:{alternation})\b", re.IGNORECASE)
+
+
+def _build_keyword_hits() -> Dict[str, Tuple[Tuple[str, str], ...]]:
+    """
+    Map every keyword to the (category, keyword) hits a match on it implies.
+
+    A phrase also credits the shorter keywords it contains as whole words
+    (e.g. "please find attached" counts as template "please find" too), since
+    the phrase regex only reports the longest match at each position.
+    """
+    keywords = {kw for words in KEYWORD_CATEGORIES.values() for kw in words}
+    hits = {}
+    for keyword in keywords:
+        hits[keyword] = tuple(
+            (category, kw)
+            for category, words in KEYWORD_CATEGORIES.items()
+            for kw in words
+            if kw == keyword or re.search(rf"\b{re.escape(kw)}\b", keyword)
+        )
+    return hits
+
+
+_KEYWORD_HITS = _build_keyword_hits()
+
+# single words are matched by token-set intersection, phrases by regex
+_WORD_RE = re.compile(r"\w+")
+_SINGLE_WORD_KEYWORDS = frozenset(kw for kw in _KEYWORD_HITS if " " not in kw)
+_PHRASE_RE = _keyword_regex([kw for kw in _KEYWORD_HITS if " " in kw])
+
+# batches above this size are scanned as one concatenated string
+_BATCH_SCAN_THRESHOLD = 8
+_BATCH_SEPARATOR = "\x1e"  # ASCII record separator, never part of a keyword match
+_KEYWORD_RE = _keyword_regex(list(_KEYWORD_HITS))
+
+
+def _build_keyword_automaton() -> Optional["ahocorasick.Automaton"]:
+    """Compile every keyword into one Aho-Corasick automaton, if pyahocorasick is installed"""
+    if not AHOCORASICK_AVAILABLE:
+        return None
+    automaton = ahocorasick.Automaton()
+    for keyword in _KEYWORD_HITS:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+
+_KEYWORD_AUTOMATON = _build_keyword_automaton()
+
+
+def _is_word_char(char: str) -> bool:
+    """Whether char counts as a word character for regex word boundaries"""
+    return char.isalnum() or char == "_"
+
+
+def _automaton_matches(content_lower: str) -> Set[str]:
+    """Keywords found by the automaton that sit on whole-word boundaries"""
+    matches = set()
+    last = len(content_lower) - 1
+    for end, keyword in _KEYWORD_AUTOMATON.iter(content_lower):
+        start = end - len(keyword) + 1
+        if start > 0 and _is_word_char(content_lower[start - 1]):
+            continue
+        if end < last and _is_word_char(content_lower[end + 1]):
+            continue
+        matches.add(keyword)
+    return matches
+
+
+@lru_cache(maxsize=4096)
+def _scan_keywords(content_lower: str) -> KeywordScan:
+    """
+    Find the distinct keywords of every category in one pass over content.
+
+    Expects content that is already lowercased. With pyahocorasick installed
+    the whole dictionary is matched by a single automaton walk. Otherwise the
+    text is tokenized once and intersected with the single-word keywords, and
+    only multi-word phrases go through a regex. Memoized on the content
+    string: templated replies and signatures recur often, and the result is
+    a read-only mapping of frozensets so it can be shared between callers.
+    """
+    if _KEYWORD_AUTOMATON is not None:
+        matches = _automaton_matches(content_lower)
+    else:
+        matches = set(_SINGLE_WORD_KEYWORDS.intersection(_WORD_RE.findall(content_lower)))
+        matches.update(_PHRASE_RE.findall(content_lower))
+
+    found: Dict[str, Set[str]] = {category: set() for category in KEYWORD_CATEGORIES}
+    for match in matches:
+        for category, keyword in _KEYWORD_HITS[match]:
+            found[category].add(keyword)
+    return MappingProxyType({category: frozenset(keywords) for category, keywords in found.items()})
+
+
+# direct-mapped front tier for _scan_keywords, indexed by the low bits of the string hash
+_SCAN_CACHE_SLOTS = 512
+_SCAN_CACHE: List[Optional[Tuple[str, KeywordScan]]] = [None] * _SCAN_CACHE_SLOTS
+
+
+def _scan_lowered(content_lower: str) -> KeywordScan:
+    """
+    Keyword scan of lowercased content through a two-tier cache.
+
+    Recently seen content is answered from a direct-mapped slot table with no
+    eviction bookkeeping; a miss falls through to the lru_cache behind
+    _scan_keywords and overwrites the slot.
+    """
+    slot = hash(content_lower) & (_SCAN_CACHE_SLOTS - 1)
+    entry = _SCAN_CACHE[slot]
+    if entry is not None and entry[0] == content_lower:
+        return entry[1]
+    scan = _scan_keywords(content_lower)
+    _SCAN_CACHE[slot] = (content_lower, scan)
+    return scan
+
+
+def _scan_content(content: str) -> KeywordScan:
+    """Keyword scan of raw message content"""
+    return _scan_lowered(content.lower())
+
+
+@lru_cache(maxsize=1024)
+def _pattern_key(kind: str, *parts: str) -> str:
+    """
+    Interned key into ObserverAgent.patterns.
+
+    Tone, message type, decision and opportunity labels come from small fixed
+    sets, so each key is formatted once and every later lookup reuses the
+    same string object.
+    """
+    return sys.intern("_".join((kind,) + parts))
+
+
+def _scan_batch(lowered: List[str]) -> List[KeywordScan]:
+    """
+    Scan a batch of lowercased messages with one regex pass over their concatenation.
+
+    Contents are joined with a record separator and every keyword match is
+    mapped back to its message with a searchsorted over the message end
+    offsets. Produces the same scans as calling _scan_lowered per message.
+    """
+    text = _BATCH_SEPARATOR.join(lowered)
+    # a separator inside some message would shift the offsets; scan those one by one
+    if text.count(_BATCH_SEPARATOR) != len(lowered) - 1:
+        return [_scan_lowered(content) for content in lowered]
+
+    ends = np.cumsum([len(content) + 1 for content in lowered])
+
+    matches = [(match.start(), match.group()) for match in _KEYWORD_RE.finditer(text)]
+    found: List[Dict[str, Set[str]]] = [
+        {category: set() for category in KEYWORD_CATEGORIES} for _ in lowered
+    ]
+    if matches:
+        starts = np.fromiter((start for start, _ in matches), dtype=np.int64, count=len(matches))
+        message_ids = np.searchsorted(ends, starts, side="right")
+        for message_id, (_, keyword) in zip(message_ids.tolist(), matches):
+            for category, hit in _KEYWORD_HITS[keyword]:
+                found[message_id][category].add(hit)
+
+    return [
+        MappingProxyType({category: frozenset(keywords) for category, keywords in message_found.items()})
+        for message_found in found
+    ]
+
+
+@dataclass(slots=True)
 class Pattern:
     """Represents a detected communication pattern"""
     pattern_type: str # email_approval, client_response, vendor_rejection, etc
@@ -32,7 +268,7 @@ class Pattern:
     last_seen: datetime = field(default_factory=datetime.now) # when was this pattern last seen
     context_clues: Dict[str, Any] = field(default_factory=dict) # additional context about the pattern
 
-@dataclass
+@dataclass(slots=True)
 class Contact:
     """Represents a contact and relationship"""
     name: str
@@ -43,6 +279,174 @@ class Contact:
     typical_topics: List[str] = field(default_factory=list)
     last_interaction: datetime = field(default_factory=datetime.now)
 
+@dataclass(slots=True)
+class CommObservation(Mapping):
+    """
+    Communication metadata extracted from one message.
+
+    Read-only mapping over its fields, so belief consumers that use
+    ``.get``/``in``/``dict(...)`` keep working alongside attribute access.
+    """
+    content_length: int # length of the message in characters
+    tone: str # formal, casual, neutral
+    urgency: str # high, medium, low
+    topics: List[str] # business topics mentioned in the message
+    sentiment: str # positive, negative, neutral
+    communication_type: str # email, chat, etc.
+    timestamp: str # ISO timestamp of the observation
+    content_hash: str # key of the full content, see ObserverAgent.get_full_content
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self):
+        return iter(self.__slots__)
+
+    def __len__(self) -> int:
+        return len(self.__slots__)
+
+class DecisionHistory:
+    """
+    Append-only, columnar record of observed decisions.
+
+    Timestamps, decision labels and confidences live in NumPy arrays that grow
+    geometrically, so trend queries can run vectorized over the whole history.
+    """
+
+    def __init__(self, capacity: int = 256):
+        self._size = 0
+        self._timestamps = np.empty(capacity, dtype=np.float64)  # unix seconds
+        self._decision_ids = np.empty(capacity, dtype=np.uint16)
+        self._confidences = np.empty(capacity, dtype=np.float64)
+        self._contexts: List[str] = []
+        self._reasonings: List[str] = []
+        self._labels: List[str] = list(DECISION_INDICATORS)
+        self._label_ids: Dict[str, int] = {label: i for i, label in enumerate(self._labels)}
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _grow(self) -> None:
+        capacity = max(1, len(self._timestamps)) * 2
+        for name in ("_timestamps", "_decision_ids", "_confidences"):
+            column = getattr(self, name)
+            grown = np.empty(capacity, dtype=column.dtype)
+            grown[:self._size] = column[:self._size]
+            setattr(self, name, grown)
+
+    def append(self, decision: str, context: str, reasoning: str, timestamp: float, confidence: float) -> None:
+        """Record one decision"""
+        if self._size == len(self._timestamps):
+            self._grow()
+
+        decision_id = self._label_ids.get(decision)
+        if decision_id is None:
+            decision_id = self._label_ids[decision] = len(self._labels)
+            self._labels.append(decision)
+
+        self._timestamps[self._size] = timestamp
+        self._decision_ids[self._size] = decision_id
+        self._confidences[self._size] = confidence
+        self._contexts.append(context)
+        self._reasonings.append(reasoning)
+        self._size += 1
+
+    def decision_counts(self) -> Dict[str, int]:
+        """Count how often each decision was observed"""
+        counts = np.bincount(self._decision_ids[:self._size], minlength=len(self._labels))
+        return {label: int(count) for label, count in zip(self._labels, counts) if count}
+
+    def to_records(self) -> List[Dict[str, Any]]:
+        """Export the history as a list of dicts"""
+        return [
+            {
+                "decision": self._labels[self._decision_ids[i]],
+                "context": self._contexts[i],
+                "reasoning": self._reasonings[i],
+                "timestamp": datetime.fromtimestamp(self._timestamps[i]).isoformat(),
+                "confidence": float(self._confidences[i])
+            }
+            for i in range(self._size)
+        ]
+
+class PatternStats:
+    """
+    Columnar mirror of the numeric Pattern fields, keyed like ObserverAgent.patterns.
+
+    Confidence, frequency and last-seen time live in parallel NumPy arrays so
+    summaries reduce over them without walking Pattern objects. Removing a
+    key moves the last row into its slot to keep the columns dense. The
+    confidence total and the count of high-confidence patterns are kept as
+    running aggregates, so the intelligence summary is O(1).
+    """
+
+    def __init__(self, capacity: int = 1024, high_confidence_threshold: float = 0.8):
+        self._size = 0
+        self.high_confidence_threshold = high_confidence_threshold
+        self._confidence_sum = 0.0
+        self.high_confidence_count = 0
+        self._keys: List[str] = []
+        self._rows: Dict[str, int] = {}
+        self._confidences = np.zeros(capacity, dtype=np.float64)
+        self._frequencies = np.zeros(capacity, dtype=np.int64)
+        self._last_seen = np.zeros(capacity, dtype=np.float64)  # unix seconds
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _grow(self) -> None:
+        capacity = max(1, len(self._confidences)) * 2
+        for name in ("_confidences", "_frequencies", "_last_seen"):
+            column = getattr(self, name)
+            grown = np.zeros(capacity, dtype=column.dtype)
+            grown[:self._size] = column[:self._size]
+            setattr(self, name, grown)
+
+    def update(self, key: str, pattern: Pattern) -> None:
+        """Record the current numeric state of a pattern"""
+        row = self._rows.get(key)
+        if row is None:
+            if self._size == len(self._confidences):
+                self._grow()
+            row = self._rows[key] = self._size
+            self._keys.append(key)
+            self._size += 1
+            self._confidences[row] = 0.0
+
+        self._track_confidence(float(self._confidences[row]), pattern.confidence)
+        self._confidences[row] = pattern.confidence
+        self._frequencies[row] = pattern.frequency
+        self._last_seen[row] = pattern.last_seen.timestamp()
+
+    def remove(self, key: str) -> None:
+        """Drop a pattern's row"""
+        row = self._rows.pop(key, None)
+        if row is None:
+            return
+
+        self._track_confidence(float(self._confidences[row]), 0.0)
+        last = self._size - 1
+        if row != last:
+            moved = self._keys[last]
+            self._keys[row] = moved
+            self._rows[moved] = row
+            for column in (self._confidences, self._frequencies, self._last_seen):
+                column[row] = column[last]
+        self._keys.pop()
+        self._size = last
+
+    def _track_confidence(self, old: float, new: float) -> None:
+        """Move the running aggregates from a row's old confidence to its new one"""
+        threshold = self.high_confidence_threshold
+        self._confidence_sum += new - old
+        self.high_confidence_count += int(new > threshold) - int(old > threshold)
+
+    def mean_confidence(self) -> float:
+        """Average confidence, 0.0 when empty"""
+        return self._confidence_sum / max(self._size, 1)
+
 class ObserverAgent(BaseAgent):
     """
     Observer Agent for Native IQ - Intelligence Collector
@@ -55,7 +459,7 @@ class ObserverAgent(BaseAgent):
     5. Workflow automation opportunities identification
     """
     
-    def __init__(self, agent_id: str = "observer_001"):
+    def __init__(self, agent_id: str = "observer_001", max_messages_in_store: int = 10000):
         super().__init__(
             agent_id=agent_id,
             agent_type="ObserverAgent",
@@ -65,8 +469,14 @@ class ObserverAgent(BaseAgent):
     
         # intelligence storage
         self.patterns: Dict[str, Pattern] = {}
+        self._automation_keys: Set[str] = set()  # keys of the automation_* entries in patterns
+        self.pattern_stats = PatternStats()  # numeric pattern fields, kept in sync by the updaters
         self.contacts: Dict[str, Contact] = {}
-        self.decision_history: List[Dict[str, Any]] = []
+        self.decision_history = DecisionHistory()
+
+        # full message text, stored once per distinct content and referenced by hash from beliefs
+        self._message_store: "OrderedDict[str, str]" = OrderedDict()
+        self.max_messages_in_store = max_messages_in_store
         
         # pattern detection thresholds
         self.pattern_confidence_threshold = 0.7
@@ -116,47 +526,68 @@ class ObserverAgent(BaseAgent):
         Full content analysis for automation
         """
         beliefs = []
+
+        # one timestamp for the whole batch
+        now_iso = datetime.now().isoformat()
         
-        for message in messages:
-            content = str(message.content)
+        contents = [str(message.content) for message in messages]
+        lowered = [content.lower() for content in contents]
+
+        # scan once for every keyword category used by the analyzers
+        if len(lowered) > _BATCH_SCAN_THRESHOLD:
+            scans = _scan_batch(lowered)
+        else:
+            scans = [_scan_lowered(content_lower) for content_lower in lowered]
+
+        for content, content_lower, scan in zip(contents, lowered, scans):
 
             # extract communication beliefs
-            comm_beliefs = await self._analyze_communication(content, context)
+            comm_beliefs = self._analyze_communication(content, context, scan, now_iso, content_lower)
             if comm_beliefs:
                 beliefs.append(comm_beliefs)
             
             # extract relationship beliefs
-            relationship_belief = await self._analyze_relationships(content, context)
+            relationship_belief = self._analyze_relationships(content, context)
             if relationship_belief:
                 beliefs.append(relationship_belief)
 
             # extract decision pattern belief
-            decision_belief = await self._analyze_decision_patterns(content, context)
+            decision_belief = self._analyze_decision_patterns(content, context, scan)
             if decision_belief:
                 beliefs.append(decision_belief)
             
             # extract automation opportunity belief
-            automation_belief = await self._identify_automation_opportunities(content, context)
+            automation_belief = self._identify_automation_opportunities(content, context, scan)
             if automation_belief:
                 beliefs.append(automation_belief)
         
         return beliefs 
 
 
-    async def _analyze_communication(self, content: str, context: Dict[str, Any]) -> Optional[Belief]:
+    def _analyze_communication(
+        self, 
+        content: str, 
+        context: Dict[str, Any], 
+        scan: Optional[KeywordScan] = None,
+        now_iso: Optional[str] = None,
+        content_lower: Optional[str] = None
+    ) -> Optional[Belief]:
         """Analyze communication style and patterns"""
 
+        if scan is None:
+            scan = _scan_content(content)
+
         # extract communication metadata
-        comm_data = {
-            "content_length": len(content), # what is the length of the message in characters
-            "tone": self._detect_tone(content), # formal, informal, neutral / what tone is the message
-            "urgency": self._detect_urgency(content), # high, normal, low / how urgent is the message
-            "topics": self._extract_topics(content), # what are the main topics in the message
-            "sentiment": self._analyze_sentiment(content), # positive, negative, neutral / what is the sentiment of the message
-            "communication_type": context.get("message_type", "unknown"), # email, chat, etc.
-            "timestamp": datetime.now().isoformat(), # when was the message sent in ISO format
-            "full_content": content  # store full content for business learning
-        }
+        comm_data = CommObservation(
+            content_length=len(content),
+            tone=self._detect_tone(content, scan),
+            urgency=self._detect_urgency(content, scan, content_lower),
+            topics=self._extract_topics(content, scan),
+            sentiment=self._analyze_sentiment(content, scan),
+            communication_type=context.get("message_type", "unknown"),
+            timestamp=now_iso or datetime.now().isoformat(),
+            content_hash=self._store_message(content)  # full content for business learning
+        )
 
         return Belief(
             type=BeliefType.OBSERVATION,
@@ -165,7 +596,23 @@ class ObserverAgent(BaseAgent):
             source="communication_analyzer"
         )
 
-    async def _analyze_relationships(
+    def _store_message(self, content: str) -> str:
+        """Store content once under its hash and return the hash"""
+        content_hash = hashlib.blake2b(content.encode(), digest_size=16).hexdigest()
+        if content_hash in self._message_store:
+            self._message_store.move_to_end(content_hash)
+        else:
+            self._message_store[content_hash] = content
+            while len(self._message_store) > self.max_messages_in_store:
+                self._message_store.popitem(last=False)
+        return content_hash
+
+    def get_full_content(self, belief: Belief) -> Optional[str]:
+        """Resolve the full message text behind a communication belief"""
+        content_hash = belief.content.get("content_hash") if isinstance(belief.content, Mapping) else None
+        return self._message_store.get(content_hash) if content_hash else None
+
+    def _analyze_relationships(
         self, 
         content: str, 
         context: Dict[str, Any]
@@ -193,24 +640,23 @@ class ObserverAgent(BaseAgent):
             source="relationship_analyzer"
         )
     
-    async def _analyze_decision_patterns(
+    def _analyze_decision_patterns(
         self, 
         content: str, 
-        context: Dict[str, Any]
+        context: Dict[str, Any], 
+        scan: Optional[KeywordScan] = None
     ) -> Optional[Belief]:
         """Analyze decision-making patterns"""
 
         # look for decision indicators
-        decision_indicators = [
-            "approve", "reject", "accept", "decline", "yes", "no",
-            "agree", "disagree", "proceed", "cancel", "postpone",
-            "support", "oppose", "endorse", "withdraw", "defer"
-        ]  # this is for simple decision making by keywords
+        matched = (scan if scan is not None else _scan_content(content))["decision"]
+        if not matched:
+            return None
 
         # look for decision patterns
         decisions_found = []
-        for indicator in decision_indicators:
-            if indicator.lower() in content.lower():
+        for indicator in DECISION_INDICATORS:
+            if indicator in matched:
                 decisions_found.append({
                     "decision": indicator,
                     "context": self._extract_decision_context(content, indicator),
@@ -235,19 +681,28 @@ class ObserverAgent(BaseAgent):
             source="decision_analyzer"
         )
     
-    async def _identify_automation_opportunities(self, content: str, context: Dict[str, Any]) -> Optional[Belief]:
+    def _identify_automation_opportunities(
+        self, 
+        content: str, 
+        context: Dict[str, Any], 
+        scan: Optional[KeywordScan] = None
+    ) -> Optional[Belief]:
         """Identify opportunities for business automation"""
         
+        if scan is None:
+            scan = _scan_content(content)
+
         # look for repetitive patterns
-        automation_signals = [
-            "same as last time", "usual response", "standard procedure",
-            "as always", "like before", "typical", "routine", 
-        ]
+        matched = scan["automation"]
+
+        # most messages carry neither signal, so skip building opportunities
+        if not (matched or scan["template"]):
+            return None
         
         # find opportunities for automation
         opportunities = []
-        for signal in automation_signals:
-            if signal in content.lower():
+        for signal in AUTOMATION_SIGNALS:
+            if signal in matched:
                 opportunities.append({
                     "type": "repetitive_response",
                     "signal": signal,
@@ -256,7 +711,7 @@ class ObserverAgent(BaseAgent):
                 })
         
         # check for template-able responses
-        if self._is_templatable_response(content, context):
+        if self._is_templatable_response(content, context, scan):
             opportunities.append({
                 "type": "template_response",
                 "template_potential": 0.9,
@@ -271,7 +726,7 @@ class ObserverAgent(BaseAgent):
         # create automation opportunity belief
         automation_data = {
             "opportunities": opportunities,
-            "automation_confidence": max([opp.get("automation_potential", 0) for opp in opportunities]),
+            "automation_confidence": max((opp.get("automation_potential", 0) for opp in opportunities), default=0),
             "business_impact": self._assess_business_impact(opportunities),
             "implementation_complexity": self._assess_complexity(opportunities)
         }
@@ -287,7 +742,7 @@ class ObserverAgent(BaseAgent):
     async def update_desires(self, beliefs: List[Belief], context: Dict[str, Any]) -> List[Desire]:
         """Update intelligence goals based on observations"""
         
-        updated_desires = self.desires.copy()
+        new_desires: List[Desire] = []
         
         # check if we have enough data for advanced analysis
         comm_beliefs = [b for b in beliefs if b.source == "communication_analyzer"]
@@ -296,7 +751,7 @@ class ObserverAgent(BaseAgent):
         
         # add desire for pattern consolidation if we have enough data
         if len(comm_beliefs) >= 10:
-            updated_desires.append(Desire(
+            new_desires.append(Desire(
                 goal="consolidate_communication_patterns",
                 priority=2,
                 conditions={"sufficient_data": True}
@@ -304,7 +759,7 @@ class ObserverAgent(BaseAgent):
         
         # add desire for automation suggestions if patterns are strong
         if automation_beliefs and any(b.confidence > 0.8 for b in automation_beliefs):
-            updated_desires.append(Desire(
+            new_desires.append(Desire(
                 goal="generate_automation_suggestions",
                 priority=1,
                 conditions={"high_confidence_patterns": True}
@@ -312,13 +767,14 @@ class ObserverAgent(BaseAgent):
 
         # add desire for decision suggestions if patterns are strong
         if decision_beliefs and any(b.confidence > 0.8 for b in decision_beliefs): # not sure if to keep this or not. 
-            updated_desires.append(Desire(
+            new_desires.append(Desire(
                 goal="generate_decision_suggestions",
                 priority=1,
                 conditions={"high_confidence_patterns": True}
             )) 
 
-        return updated_desires
+        # only allocate a merged list when something new was derived
+        return self.desires + new_desires if new_desires else self.desires
 
     
 
@@ -421,32 +877,34 @@ class ObserverAgent(BaseAgent):
         
         # update pattern confidence based on successful predictions
         completed_intentions = [i for i in intentions if i.status == "completed"]
+
+        # one timestamp for every pattern touched by this batch
+        now = datetime.now()
         
         # learn from communication patterns
         comm_beliefs = [b for b in beliefs if b.source == "communication_analyzer"]
         for belief in comm_beliefs:
-            await self._update_communication_patterns(belief.content)
+            self._update_communication_patterns(belief.content, now)
         
         # learn from decision patterns
         decision_beliefs = [b for b in beliefs if b.source == "decision_analyzer"]
         for belief in decision_beliefs:
-            await self._update_decision_patterns(belief.content)
+            self._update_decision_patterns(belief.content, now)
         
         # update automation confidence
         automation_beliefs = [b for b in beliefs if b.source == "automation_analyzer"]
         for belief in automation_beliefs:
-            await self._update_automation_patterns(belief.content)
+            self._update_automation_patterns(belief.content, now)
         
-        print(f"Observer learned from {len(beliefs)} observations and {len(completed_intentions)} actions")
+        logger.debug("Observer learned from %d observations and %d actions", len(beliefs), len(completed_intentions))
     
     # helper methods for intelligence
-    def _detect_tone(self, content: str) -> str:
+    def _detect_tone(self, content: str, scan: Optional[KeywordScan] = None) -> str:
         """Detect communication tone"""
-        formal_indicators = ["dear", "sincerely", "regards", "please find attached", "please find the attached", "please find the following", "please find the enclosed", "i've attached it to this"]
-        casual_indicators = ["hey", "thanks", "cool", "awesome", "hi", "hello", "hi there", "hello there"]
-        
-        formal_count = sum(1 for indicator in formal_indicators if indicator in content.lower())
-        casual_count = sum(1 for indicator in casual_indicators if indicator in content.lower())
+        if scan is None:
+            scan = _scan_content(content)
+        formal_count = len(scan["formal"])
+        casual_count = len(scan["casual"])
         
         if formal_count > casual_count:
             return "formal"
@@ -455,42 +913,38 @@ class ObserverAgent(BaseAgent):
         else:
             return "neutral"
     
-    def _detect_urgency(self, content: str) -> str:
+    def _detect_urgency(
+        self, 
+        content: str, 
+        scan: Optional[KeywordScan] = None, 
+        content_lower: Optional[str] = None
+    ) -> str:
         """Detect message urgency"""
-        urgent_indicators = ["urgent", "asap", "immediately", "emergency", "critical"]
-        
-        if any(indicator in content.lower() for indicator in urgent_indicators):
+        if content_lower is None:
+            content_lower = content.lower()
+        if scan is None:
+            scan = _scan_lowered(content_lower)
+        if scan["urgent"]:
             return "high"
-        elif "?" in content or "when" in content.lower():
+        elif "?" in content or "when" in content_lower:
             return "medium"
         else:
             return "low"
     
-    def _extract_topics(self, content: str) -> List[str]:
+    def _extract_topics(self, content: str, scan: Optional[KeywordScan] = None) -> List[str]:
         """Extract main topics from content"""
         # simple keyword extraction - can be enhanced with NLP
-        business_keywords = [
-            "meeting", "project", "deadline", "budget", "proposal", 
-            "contract", "invoice", "payment", "delivery", "schedule",
-            "relationship", "contact", "communication", "interaction", "collaboration",
-            "decision", "approval", "rejection", "acceptance", "decline", "yes", "no",
-            "agree", "disagree", "proceed", "cancel", "postpone", "support", "oppose", "endorse", "withdraw", "defer"
-        ]
-        
-        topics = []
-        for keyword in business_keywords:
-            if keyword in content.lower():
-                topics.append(keyword)
-        
-        return topics
+        matched = (scan if scan is not None else _scan_content(content))["topic"]
+        if not matched:
+            return []
+        return [keyword for keyword in BUSINESS_KEYWORDS if keyword in matched]
     
-    def _analyze_sentiment(self, content: str) -> str:
+    def _analyze_sentiment(self, content: str, scan: Optional[KeywordScan] = None) -> str:
         """Analyze message sentiment"""
-        positive_words = ["great", "excellent", "good", "pleased", "happy"]
-        negative_words = ["problem", "issue", "concern", "disappointed", "frustrated"]
-        
-        positive_count = sum(1 for word in positive_words if word in content.lower())
-        negative_count = sum(1 for word in negative_words if word in content.lower())
+        if scan is None:
+            scan = _scan_content(content)
+        positive_count = len(scan["positive"])
+        negative_count = len(scan["negative"])
         
         if positive_count > negative_count:
             return "positive"
@@ -502,29 +956,21 @@ class ObserverAgent(BaseAgent):
     def _extract_contacts(self, content: str) -> List[str]:
         """Extract contact names/emails from content"""
         # simple email extraction
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        emails = re.findall(email_pattern, content)
+        emails = _EMAIL_RE.findall(content)
         
         # simple name extraction (can be enhanced)
-        name_patterns = [
-            r'\b[A-Z][a-z]+ [A-Z][a-z]+\b',  # First Last
-            r'\b[A-Z]\. [A-Z][a-z]+\b'       # F. Last
-        ]
-        
-        names = []
-        for pattern in name_patterns:
-            names.extend(re.findall(pattern, content))
+        names = _NAME_RE.findall(content)
         
         return emails + names
     
-    def _is_templatable_response(self, content: str, context: Dict[str, Any]) -> bool:
+    def _is_templatable_response(
+        self, 
+        content: str, 
+        context: Dict[str, Any], 
+        scan: Optional[KeywordScan] = None
+    ) -> bool:
         """Check if response can be turned into a template"""
-        template_indicators = [
-            "thank you for", "we will", "please find", "as requested",
-            "i am writing to", "following up on"
-        ]
-        
-        return any(indicator in content.lower() for indicator in template_indicators)
+        return bool((scan if scan is not None else _scan_content(content))["template"])
     
     def _extract_template_variables(self, content: str) -> List[str]:
         """Extract variables that could be templated"""
@@ -532,15 +978,15 @@ class ObserverAgent(BaseAgent):
         variables = []
         
         # date patterns
-        if re.search(r'\d{1,2}/\d{1,2}/\d{4}', content):
+        if _DATE_RE.search(content):
             variables.append("date")
         
         # amount patterns
-        if re.search(r'\$\d+', content):
+        if _AMOUNT_RE.search(content):
             variables.append("amount")
         
         # name patterns
-        if re.search(r'\b[A-Z][a-z]+ [A-Z][a-z]+\b', content):
+        if _FULL_NAME_RE.search(content):
             variables.append("name")
         
         return variables
@@ -602,8 +1048,9 @@ class ObserverAgent(BaseAgent):
         }
 
     # Learning methods --->
-    async def _update_communication_patterns(self, content: Dict[str, Any]) -> None:
+    def _update_communication_patterns(self, content: Mapping[str, Any], now: Optional[datetime] = None) -> None:
         """Update communication pattern knowledge"""
+        now = now or datetime.now()
         try:
             # extract pattern key from communication data
             tone = content.get("tone", "neutral")
@@ -611,22 +1058,21 @@ class ObserverAgent(BaseAgent):
             topics = content.get("topics", [])
             
             # create pattern key
-            pattern_key = f"comm_{tone}_{communication_type}"
+            pattern_key = _pattern_key("comm", tone, communication_type)
             
             # update or create communication pattern
             if pattern_key in self.patterns:
                 # update existing pattern
                 pattern = self.patterns[pattern_key]
                 pattern.frequency += 1
-                pattern.last_seen = datetime.now()
+                pattern.last_seen = now
                 
                 # update confidence based on frequency
                 pattern.confidence = min(0.95, pattern.confidence + 0.05)
                 
                 # update triggers with new topics
-                for topic in topics:
-                    if topic not in pattern.triggers:
-                        pattern.triggers.append(topic)
+                known_triggers = set(pattern.triggers)
+                pattern.triggers.extend(topic for topic in topics if topic not in known_triggers)
                 
                 # update context clues
                 pattern.context_clues.update({
@@ -639,11 +1085,11 @@ class ObserverAgent(BaseAgent):
                 # create new communication pattern
                 new_pattern = Pattern(
                     pattern_type=f"communication_{tone}_{communication_type}",
-                    triggers=topics,
+                    triggers=list(topics),
                     typical_response=f"Typical {tone} {communication_type} response",
                     confidence=0.3,  # start with low confidence
                     frequency=1,
-                    last_seen=datetime.now(),
+                    last_seen=now,
                     context_clues={
                         "tone": tone,
                         "type": communication_type,
@@ -653,30 +1099,35 @@ class ObserverAgent(BaseAgent):
                     }
                 )
                 self.patterns[pattern_key] = new_pattern
+
+            self.pattern_stats.update(pattern_key, self.patterns[pattern_key])
             
-            print(f"Updated communication pattern: {pattern_key}")
+            logger.debug("Updated communication pattern: %s", pattern_key)
             
         except Exception as e:
-            print(f"Error updating communication patterns: {e}")
+            logger.error("Error updating communication patterns: %s", e)
     
-    async def _update_decision_patterns(self, content: Dict[str, Any]) -> None:
+    def _update_decision_patterns(self, content: Dict[str, Any], now: Optional[datetime] = None) -> None:
         """Update decision pattern knowledge"""
+        now = now or datetime.now()
+        now_ts = now.timestamp()
         try:
             decisions = content.get("decisions", [])
             
             for decision_data in decisions:
                 decision = decision_data.get("decision", "unknown")
+                decision_lower = decision.lower()
                 context = decision_data.get("context", "")
                 reasoning = decision_data.get("reasoning", "")
                 
                 # create pattern key for this decision type
-                pattern_key = f"decision_{decision.lower()}"
+                pattern_key = _pattern_key("decision", decision_lower)
                 
                 if pattern_key in self.patterns:
                     # update existing decision pattern
                     pattern = self.patterns[pattern_key]
                     pattern.frequency += 1
-                    pattern.last_seen = datetime.now()
+                    pattern.last_seen = now
                     
                     # Increase confidence with more examples
                     pattern.confidence = min(0.95, pattern.confidence + 0.1)
@@ -696,12 +1147,12 @@ class ObserverAgent(BaseAgent):
                 else:
                     # create new decision pattern
                     new_pattern = Pattern(
-                        pattern_type=f"decision_{decision.lower()}",
-                        triggers=[decision.lower()],
+                        pattern_type=f"decision_{decision_lower}",
+                        triggers=[decision_lower],
                         typical_response=reasoning or f"Standard {decision} response",
                         confidence=0.4,  # start with moderate confidence for decisions
                         frequency=1,
-                        last_seen=datetime.now(),
+                        last_seen=now,
                         context_clues={
                             "decision_type": decision,
                             "decision_speed": content.get("decision_speed", "medium"),
@@ -712,26 +1163,34 @@ class ObserverAgent(BaseAgent):
                         }
                     )
                     self.patterns[pattern_key] = new_pattern
+
+                self.pattern_stats.update(pattern_key, self.patterns[pattern_key])
                 
                 # store in decision history for trend analysis
-                self.decision_history.append({
-                    "decision": decision,
-                    "context": context,
-                    "reasoning": reasoning,
-                    "timestamp": datetime.now().isoformat(),
-                    "confidence": self.patterns[pattern_key].confidence
-                })
+                self.decision_history.append(
+                    decision,
+                    context,
+                    reasoning,
+                    now_ts,
+                    self.patterns[pattern_key].confidence
+                )
             
-            print(f"Updated decision patterns for {len(decisions)} decisions")
+            logger.debug("Updated decision patterns for %d decisions", len(decisions))
             
         except Exception as e:
-            print(f"Error updating decision patterns: {e}")
+            logger.error("Error updating decision patterns: %s", e)
 
     
-    async def _update_automation_patterns(self, content: Dict[str, Any]) -> None:
+    def _update_automation_patterns(self, content: Dict[str, Any], now: Optional[datetime] = None) -> None:
         """Update automation pattern knowledge"""
+        now = now or datetime.now()
         try:
             opportunities = content.get("opportunities", [])
+
+            # batch-level context shared by every opportunity
+            business_impact = content.get("business_impact", "medium")
+            implementation_complexity = content.get("implementation_complexity", "low")
+            automation_confidence = content.get("automation_confidence", 0.0)
             
             for opportunity in opportunities:
                 opp_type = opportunity.get("type", "unknown")
@@ -739,13 +1198,13 @@ class ObserverAgent(BaseAgent):
                 suggested_action = opportunity.get("suggested_action", "")
                 
                 # create pattern key for automation opportunity
-                pattern_key = f"automation_{opp_type}"
+                pattern_key = _pattern_key("automation", opp_type)
                 
                 if pattern_key in self.patterns:
                     # update existing automation pattern
                     pattern = self.patterns[pattern_key]
                     pattern.frequency += 1
-                    pattern.last_seen = datetime.now()
+                    pattern.last_seen = now
                     
                     # update confidence based on automation potential
                     new_confidence = (pattern.confidence + automation_potential) / 2
@@ -758,10 +1217,10 @@ class ObserverAgent(BaseAgent):
                     # update context clues
                     pattern.context_clues.update({
                         "automation_potential": automation_potential,
-                        "business_impact": content.get("business_impact", "medium"),
-                        "implementation_complexity": content.get("implementation_complexity", "low"),
+                        "business_impact": business_impact,
+                        "implementation_complexity": implementation_complexity,
                         "suggested_action": suggested_action,
-                        "automation_confidence": content.get("automation_confidence", 0.0)
+                        "automation_confidence": automation_confidence
                     })
                     
                 else:
@@ -772,34 +1231,38 @@ class ObserverAgent(BaseAgent):
                         typical_response=suggested_action,
                         confidence=automation_potential,
                         frequency=1,
-                        last_seen=datetime.now(),
+                        last_seen=now,
                         context_clues={
                             "opportunity_type": opp_type,
                             "automation_potential": automation_potential,
-                            "business_impact": content.get("business_impact", "medium"),
-                            "implementation_complexity": content.get("implementation_complexity", "low"),
+                            "business_impact": business_impact,
+                            "implementation_complexity": implementation_complexity,
                             "suggested_action": suggested_action,
-                            "automation_confidence": content.get("automation_confidence", 0.0)
+                            "automation_confidence": automation_confidence
                         }
                     )
                     self.patterns[pattern_key] = new_pattern
+                    self._automation_keys.add(pattern_key)
+
+                self.pattern_stats.update(pattern_key, self.patterns[pattern_key])
             
             # clean up low-confidence automation patterns (below threshold)
-            patterns_to_remove = []
-            for key, pattern in self.patterns.items():
-                if (key.startswith("automation_") and 
-                    pattern.confidence < self.automation_suggestion_threshold and 
-                    pattern.frequency < 3):
-                    patterns_to_remove.append(key)
-            
-            for key in patterns_to_remove:
-                del self.patterns[key]
-                print(f"🗑️  Removed low-confidence automation pattern: {key}")
+            for key in list(self._automation_keys):
+                pattern = self.patterns.get(key)
+                if pattern is None:
+                    self._automation_keys.discard(key)
+                    self.pattern_stats.remove(key)
+                elif (pattern.confidence < self.automation_suggestion_threshold and 
+                      pattern.frequency < 3):
+                    del self.patterns[key]
+                    self._automation_keys.discard(key)
+                    self.pattern_stats.remove(key)
+                    logger.debug("Removed low-confidence automation pattern: %s", key)
             
-            print(f"Updated automation patterns for {len(opportunities)} opportunities")
+            logger.debug("Updated automation patterns for %d opportunities", len(opportunities))
             
         except Exception as e:
-            print(f"Error updating automation patterns: {e}")
+            logger.error("Error updating automation patterns: %s", e)
     
     # additional helper methods
     def _infer_relationship_context(self, content: str) -> str:
@@ -849,7 +1312,7 @@ class ObserverAgent(BaseAgent):
             "patterns_learned": len(self.patterns),
             "contacts_mapped": len(self.contacts),
             "decisions_analyzed": len(self.decision_history),
-            "automation_opportunities": len([p for p in self.patterns.values() if p.confidence > 0.8]),
-            "learning_confidence": sum(p.confidence for p in self.patterns.values()) / max(len(self.patterns), 1),
+            "automation_opportunities": self.pattern_stats.high_confidence_count,
+            "learning_confidence": self.pattern_stats.mean_confidence(),
             "last_activity": self.last_activity.isoformat()
         }
\ No newline at end of file
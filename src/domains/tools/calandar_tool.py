@@ -4,11 +4,16 @@ Handles calendar operations and meeting scheduling
 """
 
 import os
+import sys
+import time
+import asyncio
 import logging
+import threading
 from datetime import datetime, timedelta, timezone
-# from this import d
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple, Union
 from dataclasses import dataclass
+from functools import lru_cache
+import numpy as np
 from langchain.tools import BaseTool
 from pydantic import BaseModel, Field
 from langchain_core.tools import tool
@@ -20,28 +25,112 @@ try:
     from google.oauth2.credentials import Credentials
     from google.auth.transport.requests import Request
     from google_auth_oauthlib.flow import InstalledAppFlow
-    from googleapiclient.discovery import build
+    from googleapiclient.discovery import build_from_document
     from googleapiclient.errors import HttpError
+    from googleapiclient.model import JsonModel
+    from google_auth_httplib2 import AuthorizedHttp
+    import httplib2
+    from .google_client import discovery_document, thread_http
     GOOGLE_AVAILABLE = True
 except ImportError:
     GOOGLE_AVAILABLE = False
     logging.warning("Google Calendar API not available. Install google-api-python-client")
 
+# optional faster JSON decoding of API responses
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# authorized credentials per token file, shared by every service instance in the process
+_CREDS_CACHE: Dict[str, "Credentials"] = {}
+
+# Google caps a batch HTTP request at 50 calls
+_MAX_BATCH_REQUESTS = 50
+
+# preferred time of day -> [start hour, end hour)
+_PREFERRED_TIME_RANGES = {
+    'morning': (6, 12),
+    'afternoon': (12, 18),
+    'evening': (18, 22)
+}
+
+
+@lru_cache(maxsize=4096)
+def _parse_iso(value: str) -> float:
+    """Epoch seconds of a Google API ISO timestamp, cached across freebusy queries"""
+    return datetime.fromisoformat(value.replace('Z', '+00:00')).timestamp()
+
+
+if GOOGLE_AVAILABLE and ORJSON_AVAILABLE:
+    class OrjsonModel(JsonModel):
+        """JsonModel that decodes API responses with orjson"""
+
+        def deserialize(self, content):
+            try:
+                body = orjson.loads(content)
+            except orjson.JSONDecodeError:
+                # empty or non-JSON bodies keep the stock handling
+                return super().deserialize(content)
+            if self._data_wrapper and isinstance(body, dict) and "data" in body:
+                body = body["data"]
+            return body
+
+
+def _write_token_file(token_path: str, content: str) -> None:
+    """Replace the token file atomically so concurrent readers never see a partial write"""
+    tmp_path = f"{token_path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w') as token:
+        token.write(content)
+    os.replace(tmp_path, token_path)
+
+
+def _busy_index(busy_times: List[Dict[str, str]]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Merge freebusy intervals into disjoint blocks for overlap queries.
+
+    Returns the block starts and ends as sorted integer epoch seconds.
+    Overlapping or touching intervals are merged, so a slot (s, e) overlaps
+    busy time iff the last block starting before e ends after s. Starts are
+    floored and ends ceiled, which keeps that test exact for whole-second
+    slot bounds.
+    """
+    starts = np.fromiter((_parse_iso(busy['start']) for busy in busy_times), dtype=np.float64, count=len(busy_times))
+    ends = np.fromiter((_parse_iso(busy['end']) for busy in busy_times), dtype=np.float64, count=len(busy_times))
+    starts = np.floor(starts).astype(np.int64)
+    ends = np.ceil(ends).astype(np.int64)
+
+    if not len(starts):
+        return starts, ends
 
-@dataclass
+    order = np.argsort(starts, kind='stable')
+    starts, ends = starts[order], ends[order]
+
+    # a new block begins wherever an interval starts after everything before it has ended
+    reach = np.maximum.accumulate(ends)
+    block_firsts = np.flatnonzero(np.concatenate(([True], starts[1:] > reach[:-1])))
+    return starts[block_firsts], np.maximum.reduceat(ends, block_firsts)
+
+
+@dataclass(slots=True)
 class MeetingDetails:
     """Meeting details structure"""
     title: str
     start_time: datetime
     end_time: datetime
-    attendees: List[str]
+    attendees: Tuple[str, ...]  # any iterable of emails is accepted and stored as an interned tuple
     description: str = ""
     location: str = ""
     meeting_type: str = "business"
 
-@dataclass
+    def __post_init__(self):
+        # the same coworkers recur across meetings, so share their address strings
+        self.attendees = tuple(sys.intern(email) for email in self.attendees)
+
+@dataclass(slots=True)
 class TimeSlot:
     """Available time slot"""
     start_time: datetime
@@ -81,6 +170,19 @@ class GoogleCalendarService:
         self.business_hours_start = 9  # 9 AM
         self.business_hours_end = 18   # 6 PM
 
+        # short-lived cache of read results: key -> (monotonic time stored, result)
+        self.cache_ttl_seconds = 30
+        self._result_cache: Dict[tuple, Tuple[float, List[Any]]] = {}
+
+        # merged freebusy blocks per (calendars, first day, last day) window, shared across durations:
+        # key -> (monotonic time stored, window start, window end, block starts, block ends)
+        self.freebusy_ttl_seconds = 180
+        self._busy_cache: Dict[tuple, Tuple[float, float, float, np.ndarray, np.ndarray]] = {}
+
+        # one authorized keep-alive connection per thread; httplib2.Http is not thread-safe
+        self.http_timeout = 30
+        self._local = threading.local()
+
         if GOOGLE_AVAILABLE:
             self._initialize_service()
 
@@ -90,7 +192,11 @@ class GoogleCalendarService:
             self.credentials = self._load_credentials()
 
             if self.credentials and self.credentials.valid:
-                self.service = build('calendar', 'v3', credentials=self.credentials)
+                self.service = build_from_document(
+                    discovery_document('calendar', 'v3'),
+                    http=self._thread_http(),
+                    model=OrjsonModel() if ORJSON_AVAILABLE else None
+                )
                 logger.info("Google Calendar service initialized successfully")
             else:
                 logger.warning("Google Calendar credentials not valid")
@@ -105,14 +211,17 @@ class GoogleCalendarService:
             token_path = os.getenv('GOOGLE_CALENDAR_TOKEN_PATH', 'calendar_token.json')
             credentials_path = os.getenv('GOOGLE_CALENDAR_CREDENTIALS_PATH', 'credentials.json')
             
-            creds = None
+            creds = _CREDS_CACHE.get(token_path)
+            if creds and creds.valid:
+                return creds
             
             # load existing token
-            if os.path.exists(token_path):
+            if creds is None and os.path.exists(token_path):
                 creds = Credentials.from_authorized_user_file(token_path, self.scopes)
             
             # if no valid credentials, run auth flow
             if not creds or not creds.valid:
+                old_token = creds.token if creds else None
                 if creds and creds.expired and creds.refresh_token:
                     creds.refresh(Request())
                 else:
@@ -123,65 +232,138 @@ class GoogleCalendarService:
                         logger.error(f"Credentials file not found: {credentials_path}")
                         return None
                 
-                # save credentials
-                with open(token_path, 'w') as token:
-                    token.write(creds.to_json())
+                # save credentials, unless the refresh handed back the same token
+                if creds.token != old_token:
+                    _write_token_file(token_path, creds.to_json())
             
+            _CREDS_CACHE[token_path] = creds
             return creds
             
         except Exception as e:
             logger.error(f"Error loading Google Calendar credentials: {e}")
             return None
 
+    def _thread_http(self) -> "AuthorizedHttp":
+        """Authorized HTTP client owned by the calling thread, reused across requests"""
+        return thread_http(self._local, self.credentials, self.http_timeout)
+
+    async def _execute(self, request: Any) -> Any:
+        """Execute an API request in a worker thread over that thread's pooled connection"""
+        return await asyncio.to_thread(lambda: request.execute(http=self._thread_http()))
+
+    def _cached(self, key: tuple) -> Optional[List[Any]]:
+        """Return a cached read result if it is younger than the TTL"""
+        entry = self._result_cache.get(key)
+        if entry is not None and time.monotonic() - entry[0] < self.cache_ttl_seconds:
+            return list(entry[1])
+        return None
+
+    def _store(self, key: tuple, result: List[Any]) -> None:
+        """Cache a read result"""
+        self._result_cache[key] = (time.monotonic(), list(result))
+
+    async def _busy_blocks(
+        self,
+        calendar_ids: Tuple[str, ...],
+        window_start: datetime,
+        window_end: datetime
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Merged busy blocks over whole-day windows, served from cache while younger than the TTL"""
+        key = (calendar_ids, window_start.date().isoformat(), window_end.date().isoformat())
+        entry = self._busy_cache.get(key)
+        if entry is not None and time.monotonic() - entry[0] < self.freebusy_ttl_seconds:
+            return entry[3], entry[4]
+
+        freebusy_query = {
+            'timeMin': window_start.isoformat(),
+            'timeMax': window_end.isoformat(),
+            'items': [{'id': calendar_id} for calendar_id in calendar_ids]
+        }
+
+        request = self.service.freebusy().query(body=freebusy_query)
+        freebusy_result = await self._execute(request)
+        calendars = freebusy_result['calendars']
+        busy_times = [busy for calendar_id in calendar_ids for busy in calendars[calendar_id]['busy']]
+        busy_start, busy_end = _busy_index(busy_times)
+
+        self._busy_cache[key] = (
+            time.monotonic(), window_start.timestamp(), window_end.timestamp(), busy_start, busy_end
+        )
+        return busy_start, busy_end
+
+    def _invalidate_busy(self, meeting: MeetingDetails) -> None:
+        """Drop cached freebusy windows that overlap a newly created meeting"""
+        # naive times are sent to the API as UTC, so read them the same way here
+        start = meeting.start_time if meeting.start_time.tzinfo else meeting.start_time.replace(tzinfo=timezone.utc)
+        end = meeting.end_time if meeting.end_time.tzinfo else meeting.end_time.replace(tzinfo=timezone.utc)
+        start_ts, end_ts = start.timestamp(), end.timestamp()
+
+        for key in [key for key, entry in self._busy_cache.items() if entry[1] < end_ts and start_ts < entry[2]]:
+            del self._busy_cache[key]
+
+    def _build_event(self, meeting: MeetingDetails) -> Dict[str, Any]:
+        """Build the Calendar API event body for a meeting"""
+        event = {
+            'summary': meeting.title,
+            'description': meeting.description,
+            'start': {
+                'dateTime': meeting.start_time.isoformat(),
+                'timeZone': 'UTC',
+            },
+            'end': {
+                'dateTime': meeting.end_time.isoformat(),
+                'timeZone': 'UTC',
+            },
+            'attendees': [{'email': email} for email in meeting.attendees],
+            'reminders': {
+                'useDefault': False,
+                'overrides': [
+                    {'method': 'email', 'minutes': 24 * 60},
+                    {'method': 'popup', 'minutes': 15},
+                ],
+            },
+        }
+
+        if meeting.location:
+            event['location'] = meeting.location
+
+        return event
+
+    def _created_meeting_result(self, meeting: MeetingDetails, created_event: Dict[str, Any]) -> Dict[str, Any]:
+        """Summarize a created event for callers"""
+        return {
+            'event_id': created_event.get('id'),
+            'html_link': created_event.get('htmlLink'),
+            'status': 'created',
+            'title': meeting.title,
+            'start_time': meeting.start_time.isoformat(),
+            'attendees': meeting.attendees
+        }
+
     async def create_meeting(
         self,
-        meeting: MeetingDetails
-    ) -> Optional[Dict[str, Any]]:
-        """Create a calendar meeting"""
+        meeting: Union[MeetingDetails, List[MeetingDetails]]
+    ) -> Union[Optional[Dict[str, Any]], List[Optional[Dict[str, Any]]]]:
+        """Create a calendar meeting, or several in batched requests when given a list"""
+
+        if isinstance(meeting, list):
+            return await self.create_meetings_batch(meeting)
 
         if not self.service:
             logger.error("Google Calendar service not initialized")
             return None
 
         try:
-            event = {
-                'summary': meeting.title,
-                'description': meeting.description,
-                'start': {
-                    'dateTime': meeting.start_time.isoformat(),
-                    'timeZone': 'UTC',
-                },
-                'end': {
-                    'dateTime': meeting.end_time.isoformat(),
-                    'timeZone': 'UTC',
-                },
-                'attendees': [{'email': email} for email in meeting.attendees],
-                'reminders': {
-                    'useDefault': False,
-                    'overrides': [
-                        {'method': 'email', 'minutes': 24 * 60},
-                        {'method': 'popup', 'minutes': 15},
-                    ],
-                },
-            }
-
-            if meeting.location:
-                event['location'] = meeting.location
-
-            created_event = self.service.events().insert(
+            request = self.service.events().insert(
                 calendarId=self.default_calendar_id,
-                body=event,
+                body=self._build_event(meeting),
                 sendUpdates='all'
-            ).execute()
+            )
+            created_event = await self._execute(request)
+            self._result_cache.clear()
+            self._invalidate_busy(meeting)
 
-            return {
-                'event_id': created_event.get('id'),
-                'html_link': created_event.get('htmlLink'),
-                'status': 'created',
-                'title': meeting.title,
-                'start_time': meeting.start_time.isoformat(),
-                'attendees': meeting.attendees
-            }
+            return self._created_meeting_result(meeting, created_event)
 
         except HttpError as e:
             logger.error(f"HTTP error creating meeting: {e}")
@@ -189,63 +371,143 @@ class GoogleCalendarService:
         except Exception as e:
             logger.error(f"Error creating meeting: {e}")
             return None
+
+    async def create_meetings_batch(
+        self,
+        meetings: List[MeetingDetails]
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Create several calendar meetings over batched HTTP requests.
+
+        Inserts are sent in groups of up to 50 per round-trip. Returns one
+        result per meeting, in order, with None for meetings that failed.
+        """
+
+        results: List[Optional[Dict[str, Any]]] = [None] * len(meetings)
+
+        if not self.service:
+            logger.error("Google Calendar service not initialized")
+            return results
+
+        # the callback runs on the worker thread; busy cache invalidation waits for the event loop
+        created: List[int] = []
+
+        def on_created(request_id: str, response: Dict[str, Any], exception: Optional[Exception]) -> None:
+            index = int(request_id)
+            if exception is not None:
+                logger.error(f"Error creating meeting {meetings[index].title}: {exception}")
+                return
+            results[index] = self._created_meeting_result(meetings[index], response)
+            created.append(index)
+
+        try:
+            for offset in range(0, len(meetings), _MAX_BATCH_REQUESTS):
+                batch = self.service.new_batch_http_request(callback=on_created)
+                for index in range(offset, min(offset + _MAX_BATCH_REQUESTS, len(meetings))):
+                    batch.add(
+                        self.service.events().insert(
+                            calendarId=self.default_calendar_id,
+                            body=self._build_event(meetings[index]),
+                            sendUpdates='all'
+                        ),
+                        request_id=str(index)
+                    )
+                try:
+                    await self._execute(batch)
+                finally:
+                    for index in created:
+                        self._invalidate_busy(meetings[index])
+                    created.clear()
+                self._result_cache.clear()
+
+        except HttpError as e:
+            logger.error(f"HTTP error creating meetings: {e}")
+        except Exception as e:
+            logger.error(f"Error creating meetings: {e}")
+
+        return results
         
-    async def find_free_slots(self, duration_minutes: int = 60, days_ahead: int = 7) -> List[TimeSlot]:
-        """Find available time slots"""
+    async def find_free_slots(
+        self,
+        duration_minutes: int = 60,
+        days_ahead: int = 7,
+        calendar_ids: Optional[List[str]] = None
+    ) -> List[TimeSlot]:
+        """
+        Find available time slots.
+
+        A slot is free only if it is free in every calendar in calendar_ids
+        (the default calendar when omitted). All calendars are queried in a
+        single freebusy round-trip.
+        """
         if not self.service:
             logger.error("Google Calendar service not available")
             return []
 
+        calendar_ids = tuple(calendar_ids or (self.default_calendar_id,))
+        cache_key = ('free_slots', duration_minutes, days_ahead, calendar_ids)
+        cached = self._cached(cache_key)
+        if cached is not None:
+            return cached
+
         try:
             now = datetime.now(tz=tz.tzutc())
-            time_min = now.isoformat()
-            time_max = (now + timedelta(days=days_ahead)).isoformat()
 
-            freebusy_query = {
-                'timeMin': time_min,
-                'timeMax': time_max,
-                'items': [{'id': self.default_calendar_id}]
-            }
+            # fetch whole days so later calls in the same window reuse the result
+            window_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+            busy_start, busy_end = await self._busy_blocks(
+                calendar_ids, window_start, window_start + timedelta(days=days_ahead + 1)
+            )
+
+            first_day_start = now.replace(hour=self.business_hours_start, minute=0, second=0, microsecond=0)
+
+            # weekdays only, as day offsets from today
+            day_offsets = np.arange(days_ahead, dtype=np.int64)
+            day_offsets = day_offsets[(first_day_start.weekday() + day_offsets) % 7 < 5]
+
+            # every 30 minutes from opening until the meeting would run past closing
+            duration = duration_minutes * 60
+            business_day = (self.business_hours_end - self.business_hours_start) * 3600
+            slot_offsets = np.arange(0, business_day - duration + 1, 1800, dtype=np.int64)
+
+            slot_starts = (
+                int(first_day_start.timestamp()) + day_offsets[:, None] * 86400 + slot_offsets[None, :]
+            ).ravel()
+            slot_ends = slot_starts + duration
+
+            # last busy interval starting before a slot ends decides the overlap
+            if len(busy_start):
+                idx = np.searchsorted(busy_start, slot_ends) - 1
+                free_mask = (idx < 0) | (busy_end[np.maximum(idx, 0)] <= slot_starts)
+            else:
+                free_mask = np.ones(len(slot_starts), dtype=bool)
 
-            freebusy_result = self.service.freebusy().query(body=freebusy_query).execute()
-            busy_times = freebusy_result['calendars'][self.default_calendar_id]['busy']
+            free_starts = slot_starts[free_mask]
+            logger.info(f"Found {len(free_starts)} free slots")
 
+            # only the returned prefix becomes TimeSlot objects
+            slot_length = timedelta(seconds=duration)
             free_slots = []
-            current_time = now.replace(minute=0, second=0, microsecond=0)
-
-            for day in range(days_ahead):
-                day_start = current_time.replace(hour=self.business_hours_start) + timedelta(days=day)
-                day_end = current_time.replace(hour=self.business_hours_end) + timedelta(days=day)
-
-                if day_start.weekday() >= 5: # skip weekends
-                    continue
-
-                slot_start = day_start
-                while slot_start + timedelta(minutes=duration_minutes) <= day_end:
-                    slot_end = slot_start + timedelta(minutes=duration_minutes)
-
-                    is_free = True
-                    for busy in busy_times:
-                        busy_start = datetime.fromisoformat(busy['start'].replace('Z', '+00:00'))
-                        busy_end = datetime.fromisoformat(busy['end'].replace('Z', '+00:00'))
-                        
-                        if (slot_start < busy_end and slot_end > busy_start):
-                            is_free = False
-                            break
-                    
-                    if is_free:
-                        free_slots.append(TimeSlot(
-                            start_time=slot_start,
-                            end_time=slot_end,
-                            duration_minutes=duration_minutes
-                        ))
-                    
-                    slot_start += timedelta(minutes=30)
-            logger.info(f"Found {len(free_slots)} free slots")
-            return free_slots[:10]
+            for start_ts in free_starts[:10].tolist():
+                slot_start = datetime.fromtimestamp(start_ts, tz=now.tzinfo)
+                free_slots.append(TimeSlot(
+                    start_time=slot_start,
+                    end_time=slot_start + slot_length,
+                    duration_minutes=duration_minutes
+                ))
 
-        except Exception as e:
-            logger.error(f"Error finding free slots: {e}")
+            self._store(cache_key, free_slots)
+            return free_slots
+
+        except HttpError as e:
+            logger.error(f"HTTP error finding free slots: {e}")
+            return []
+        except (OSError, httplib2.HttpLib2Error) as e:
+            logger.error(f"Network error finding free slots: {e}")
+            return []
+        except KeyError as e:
+            # a requested calendar is missing from the freebusy response
+            logger.error(f"Malformed freebusy response, missing {e}")
             return []
 
     async def get_upcoming_meetings(self, days_ahead: int = 7) -> List[Dict[str, Any]]:
@@ -253,43 +515,56 @@ class GoogleCalendarService:
 
         if not self.service:
             return []
+
+        cache_key = ('upcoming_meetings', days_ahead)
+        cached = self._cached(cache_key)
+        if cached is not None:
+            return cached
         
         try:
             now = datetime.now(tz=tz.tzutc())
             time_min = now.isoformat()
             time_max = (now + timedelta(days=days_ahead)).isoformat()
             
-            events_result = self.service.events().list(
+            request = self.service.events().list(
                 calendarId=self.default_calendar_id,
                 timeMin=time_min,
                 timeMax=time_max,
                 maxResults=20,
                 singleEvents=True,
-                orderBy='startTime'
-            ).execute()
+                orderBy='startTime',
+                fields='items(id,summary,start,attendees/email,location,htmlLink)'  # only what we read below
+            )
+            events_result = await self._execute(request)
             
-            events = events_result.get('items', [])
+            events = events_result.get('items') or ()
+            intern = sys.intern
             
-            meetings = []
-            for event in events:
-                start = event['start'].get('dateTime', event['start'].get('date'))
-                meetings.append({
+            meetings = [
+                {
                     'id': event['id'],
                     'title': event.get('summary', 'No Title'),
-                    'start_time': start,
-                    'attendees': [att.get('email') for att in event.get('attendees', [])],
+                    'start_time': event['start'].get('dateTime') or event['start'].get('date'),
+                    'attendees': tuple(
+                        intern(att['email']) for att in event.get('attendees') or () if att.get('email')
+                    ),
                     'location': event.get('location', ''),
                     'html_link': event.get('htmlLink', '')
-                })
+                }
+                for event in events
+            ]
             
+            self._store(cache_key, meetings)
             return meetings
             
         except Exception as e:
             logger.error(f"Error getting upcoming meetings: {e}")
             return []
         
-# GLOBAL CALENDAR SERVICE INSTANCE
-calendar_service = GoogleCalendarService()
+@lru_cache(maxsize=1)
+def get_calendar_service() -> GoogleCalendarService:
+    """Shared calendar service, created (and authorized) on first use rather than at import"""
+    return GoogleCalendarService()
 
 
 @tool("schedule_meeting", args_schema=ScheduleMeetingInput)
@@ -336,7 +611,7 @@ async def schedule_meeting(
         )
         
         
-        result = await calendar_service.create_meeting(meeting)
+        result = await get_calendar_service().create_meeting(meeting)
 
         if result:
             return f"Meeting `{title}` scheduled successfully for {start_time}. Event ID: {result['event_id']}."
@@ -364,7 +639,7 @@ async def find_free_slots(
         String with available time slots
     """
     try:
-        slots = await calendar_service.find_free_slots(duration_minutes, days_ahead)
+        slots = await get_calendar_service().find_free_slots(duration_minutes, days_ahead)
         
         if not slots:
             return f"No free slots found for {duration_minutes} minutes in the next {days_ahead} days"
@@ -376,21 +651,13 @@ async def find_free_slots(
             )
         
         if preferred_times:
-            preferred_slots = []
-            time_ranges = {
-                'morning': (6, 12),
-                'afternoon': (12, 18),
-                'evening': (18, 22)
-            }
-            for slot in slots:
-                hour = slot.start_time.hour
-                for time_pref in preferred_times:
-                    key = time_pref.lower()
-                    if key in time_ranges:
-                        start_hour, end_hour = time_ranges[key]
-                        if start_hour <= hour < end_hour:
-                            preferred_slots.append(slot)
-                            break
+            # bit h set when hour h falls in any preferred range
+            hour_mask = 0
+            for time_pref in preferred_times:
+                start_hour, end_hour = _PREFERRED_TIME_RANGES.get(time_pref.lower(), (0, 0))
+                hour_mask |= (1 << end_hour) - (1 << start_hour)
+
+            preferred_slots = [slot for slot in slots if (hour_mask >> slot.start_time.hour) & 1]
 
             if preferred_slots:
                 slot_list = []
@@ -419,7 +686,7 @@ async def get_upcoming_meetings(days_ahead: int = 7) -> str:
     """
 
     try:
-        meetings = await calendar_service.get_upcoming_meetings(days_ahead)
+        meetings = await get_calendar_service().get_upcoming_meetings(days_ahead)
         
         if not meetings:
             return f"No upcoming meetings in the next {days_ahead} days"
@@ -1,10 +1,12 @@
-from email.mime.base import MIMEBase
+import io
 import os
+import base64
+import asyncio
+import atexit
 import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-from email import encoders
-from typing import List, Optional, Dict, Any
+import threading
+from email.message import EmailMessage, MIMEPart
+from typing import List, Optional, Dict, Any, Tuple
 from dataclasses import dataclass
 from pydantic import Field
 from datetime import datetime  
@@ -46,7 +48,160 @@ class EmailService:
         self.sender_email = os.getenv('SMTP_EMAIL')
         self.sender_password = os.getenv('SMTP_PASSWORD')
         self.sender_name = os.getenv('SMTP_SENDER_NAME', 'Native IQ')
+
+        # one logged-in SMTP session reused across sends; smtplib.SMTP is not thread-safe
+        self._smtp: Optional[smtplib.SMTP] = None
+        self._smtp_lock = threading.Lock()
+        atexit.register(self.close)
+
+        # base64 attachment payloads by path, valid while the file's mtime and size are unchanged
+        self._attachment_cache: Dict[str, Tuple[int, int, str]] = {}
+
+    def _get_conn(self) -> smtplib.SMTP:
+        """Return a live SMTP session, reconnecting if the server dropped the old one. Call with _smtp_lock held."""
+        if self._smtp is not None:
+            try:
+                if self._smtp.noop()[0] == 250:
+                    return self._smtp
+            except (smtplib.SMTPException, OSError):
+                pass
+            self._drop_conn()
+
+        self._smtp = self._open_conn()
+        return self._smtp
+
+    def _open_conn(self) -> smtplib.SMTP:
+        """Connect, upgrade to TLS and log in"""
+        server = smtplib.SMTP(self.smtp_server, self.smtp_port)
+        server.starttls()
+        server.login(self.sender_email, self.sender_password)
+        return server
+
+    @staticmethod
+    def _quit_quietly(conn: smtplib.SMTP) -> None:
+        """End an SMTP session, ignoring a server that already hung up"""
+        try:
+            conn.quit()
+        except (smtplib.SMTPException, OSError):
+            conn.close()
+
+    def _drop_conn(self) -> None:
+        """Forget the cached session without waiting on a server that may be gone"""
+        if self._smtp is not None:
+            try:
+                self._smtp.close()
+            finally:
+                self._smtp = None
+
+    def close(self) -> None:
+        """End the cached SMTP session, if any"""
+        with self._smtp_lock:
+            if self._smtp is not None:
+                self._quit_quietly(self._smtp)
+                self._smtp = None
     
+    def _build_mime(self, email: EmailDetails) -> EmailMessage:
+        """Assemble the MIME message for an email, attachments included"""
+        # Create message
+        msg = EmailMessage()
+        
+        # Handle on_behalf_of in From header
+        if email.on_behalf_of:
+            from_header = f"{self.sender_name} on behalf of {email.on_behalf_of} <{self.sender_email}>"
+        else:
+            from_header = f"{self.sender_name} <{self.sender_email}>"
+        
+        msg['From'] = from_header
+        msg['To'] = email.recipient
+        msg['Subject'] = email.subject
+
+        if email.cc:
+            msg['Cc'] = ', '.join(email.cc)
+        if email.bcc:
+            msg['Bcc'] = ', '.join(email.bcc)
+        
+        # signature to body if on_behalf_of is provided
+        body_content = email.body
+        if email.on_behalf_of:
+            signature = f"\n\n{email.on_behalf_of}\n\nNative IQ on behalf of {email.on_behalf_of}"
+            body_content = f"{email.body}{signature}"
+        
+        # Add body
+        msg.set_content(body_content)
+        if email.html_body:
+            # Also modify HTML body if provided
+            html_content = email.html_body
+            if email.on_behalf_of:
+                html_signature = f"<br><br><strong>{email.on_behalf_of}</strong><br><br><em>Native IQ on behalf of {email.on_behalf_of}</em>"
+                html_content = f"{email.html_body}{html_signature}"
+            
+            msg.add_alternative(html_content, subtype='html')
+
+        # Add attachments if provided
+        if email.attachments:
+            for file_path in email.attachments:
+                try:
+                    part = self._build_attachment_part(file_path)
+                except OSError as e:
+                    logger.warning(f"Skipping attachment {file_path}: {e}")
+                    continue
+
+                # pre-encoded parts go in directly, so wrap the body in multipart/mixed first
+                if msg.get_content_type() != 'multipart/mixed':
+                    msg.make_mixed()
+                msg.attach(part)
+
+        return msg
+
+    def _build_attachment_part(self, file_path: str) -> MIMEPart:
+        """
+        Attachment part for a file, reusing its encoded payload across sends while the file is unchanged.
+
+        The stat doubles as the existence check; raises OSError if the file is missing or unreadable.
+        """
+        stat = os.stat(file_path)
+        cached = self._attachment_cache.get(file_path)
+
+        part = MIMEPart()
+        part['Content-Type'] = 'application/octet-stream'
+        if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            part.set_payload(cached[2])
+            part['Content-Transfer-Encoding'] = 'base64'
+        else:
+            # encode while reading in chunks, so the raw file is never held in memory alongside its encoding
+            encoded = io.BytesIO()
+            with open(file_path, "rb") as attachment:
+                base64.encode(attachment, encoded)
+
+            # same 76-column text that encoders.encode_base64 produces
+            payload = encoded.getvalue().decode('ascii')
+            part.set_payload(payload)
+            part['Content-Transfer-Encoding'] = 'base64'
+            self._attachment_cache[file_path] = (stat.st_mtime_ns, stat.st_size, payload)
+
+        part.add_header('Content-Disposition', 'attachment', filename=os.path.basename(file_path))
+        return part
+
+    def _recipients(self, email: EmailDetails) -> List[str]:
+        """Envelope recipients: To, Cc and Bcc"""
+        recipients = [email.recipient]
+        if email.cc:
+            recipients.extend(email.cc)
+        if email.bcc:
+            recipients.extend(email.bcc)
+        return recipients
+
+    def _sent_result(self, email: EmailDetails) -> Dict[str, Any]:
+        """Result returned for a delivered email"""
+        logger.info(f"Email sent successfully to {email.recipient}")
+        return {
+            "success": True,
+            "recipient": email.recipient,
+            "subject": email.subject,
+            "timestamp": datetime.now().isoformat(),
+            "message_id": f"email_{datetime.now().timestamp()}"
+        }
+
     def send_email(self, email: EmailDetails) -> Dict[str, Any]:
         try:
             if not self.sender_email or not self.sender_password:
@@ -55,83 +210,26 @@ class EmailService:
                     "error": "Email credentials not configured"
                 }
             
-            # Create message
-            msg = MIMEMultipart('alternative')
-            
-            # Handle on_behalf_of in From header
-            if email.on_behalf_of:
-                from_header = f"{self.sender_name} on behalf of {email.on_behalf_of} <{self.sender_email}>"
-            else:
-                from_header = f"{self.sender_name} <{self.sender_email}>"
+            msg = self._build_mime(email)
+            recipients = self._recipients(email)
             
-            msg['From'] = from_header
-            msg['To'] = email.recipient
-            msg['Subject'] = email.subject
-
-            if email.cc:
-                msg['Cc'] = ', '.join(email.cc)
-            if email.bcc:
-                msg['Bcc'] = ', '.join(email.bcc)
-            
-            # signature to body if on_behalf_of is provided
-            body_content = email.body
-            if email.on_behalf_of:
-                signature = f"\n\n{email.on_behalf_of}\n\nNative IQ on behalf of {email.on_behalf_of}"
-                body_content = f"{email.body}{signature}"
-            
-            # Add body
-            if email.html_body:
-                # Also modify HTML body if provided
-                html_content = email.html_body
-                if email.on_behalf_of:
-                    html_signature = f"<br><br><strong>{email.on_behalf_of}</strong><br><br><em>Native IQ on behalf of {email.on_behalf_of}</em>"
-                    html_content = f"{email.html_body}{html_signature}"
-                
-                text_part = MIMEText(body_content, 'plain')
-                html_part = MIMEText(html_content, 'html')
-                msg.attach(text_part)
-                msg.attach(html_part)
-            else:
-                text_part = MIMEText(body_content, 'plain')
-                msg.attach(text_part)
-
-            # Add attachments if provided
-            if email.attachments:
-                for file_path in email.attachments:
-                    if os.path.exists(file_path):
-                        with open(file_path, "rb") as attachment:
-                            part = MIMEBase("application", "octet-stream")
-                            part.set_payload(attachment.read())
-                            
-                        encoders.encode_base64(part)
-                        part.add_header(
-                            "Content-Disposition",
-                            f"attachment; filename= {os.path.basename(file_path)}"
-                        )
-                        msg.attach(part)
-
-            # SMTP session
-            server = smtplib.SMTP(self.smtp_server, self.smtp_port)
-            server.starttls()
-            server.login(self.sender_email, self.sender_password)
-
-            recipients = [email.recipient]
-            if email.cc:
-                recipients.extend(email.cc)
-            if email.bcc:
-                recipients.extend(email.bcc)
-            
-            server.sendmail(self.sender_email, recipients, msg.as_string())
-            server.quit()
+            # SMTP session, reused across sends
+            with self._smtp_lock:
+                try:
+                    conn = self._get_conn()
+                except (smtplib.SMTPServerDisconnected, OSError):
+                    # nothing has been sent yet, so one fresh attempt is safe
+                    self._drop_conn()
+                    conn = self._get_conn()
 
-            logger.info(f"Email sent successfully to {email.recipient}") 
-            return {
-                "success": True,
-                "recipient": email.recipient,
-                "subject": email.subject,
-                "timestamp": datetime.now().isoformat(),
-                "message_id": f"email_{datetime.now().timestamp()}"
-            }   
+                try:
+                    conn.send_message(msg, from_addr=self.sender_email, to_addrs=recipients)
+                except smtplib.SMTPServerDisconnected:
+                    # the server may already have accepted the message; report instead of resending
+                    self._drop_conn()
+                    raise
+
+            return self._sent_result(email)
 
         except Exception as e:
             logger.error(f"Failed to send email: {e}")
@@ -140,6 +238,53 @@ class EmailService:
                 "error": str(e)
             }
 
+    async def send_email_async(self, email: EmailDetails) -> Dict[str, Any]:
+        """send_email for async callers: attachment reads, MIME assembly and SMTP all run in a worker thread"""
+        return await asyncio.to_thread(self.send_email, email)
+
+    async def send_emails_bulk(self, emails: List[EmailDetails], concurrency: int = 10) -> List[Dict[str, Any]]:
+        """
+        Send many emails over up to `concurrency` parallel SMTP sessions.
+
+        Each worker logs in once and sends its share of the emails from a
+        worker thread, so the event loop stays free. Returns one result per
+        email, in order.
+        """
+        if concurrency < 1:
+            raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+        if not self.sender_email or not self.sender_password:
+            return [{"success": False, "error": "Email credentials not configured"} for _ in emails]
+
+        results: List[Optional[Dict[str, Any]]] = [None] * len(emails)
+        pending = iter(range(len(emails)))
+
+        def deliver(conn: smtplib.SMTP, email: EmailDetails) -> None:
+            conn.send_message(self._build_mime(email), from_addr=self.sender_email, to_addrs=self._recipients(email))
+
+        async def worker() -> None:
+            conn: Optional[smtplib.SMTP] = None
+            try:
+                # the shared iterator hands each index to exactly one worker
+                for index in pending:
+                    email = emails[index]
+                    try:
+                        if conn is None:
+                            conn = await asyncio.to_thread(self._open_conn)
+                        await asyncio.to_thread(deliver, conn, email)
+                        results[index] = self._sent_result(email)
+                    except Exception as e:
+                        logger.error(f"Failed to send email to {email.recipient}: {e}")
+                        results[index] = {"success": False, "error": str(e)}
+                        if conn is not None and isinstance(e, (smtplib.SMTPServerDisconnected, OSError)):
+                            # the session is unusable; release its socket before reconnecting
+                            conn.close()
+                            conn = None
+            finally:
+                if conn is not None:
+                    await asyncio.to_thread(self._quit_quietly, conn)
+
+        await asyncio.gather(*(worker() for _ in range(min(concurrency, len(emails)))))
+        return results
 
 email_service = EmailService()
 
@@ -0,0 +1,33 @@
+"""
+Google API client helpers shared by the Native IQ Google tools
+Discovery documents and per-thread authorized HTTP connections
+"""
+
+import json
+import threading
+from functools import lru_cache
+from typing import Any, Dict, Optional
+
+import httplib2
+from google_auth_httplib2 import AuthorizedHttp
+from googleapiclient.discovery_cache import get_static_doc
+
+
+@lru_cache(maxsize=None)
+def discovery_document(service_name: str, version: str) -> Dict[str, Any]:
+    """Discovery document bundled with googleapiclient, read and parsed once per process"""
+    return json.loads(get_static_doc(service_name, version))
+
+
+def thread_http(local: threading.local, credentials: Any, timeout: Optional[float] = None) -> AuthorizedHttp:
+    """
+    Authorized HTTP client owned by the calling thread.
+
+    httplib2.Http is not thread-safe, so each thread keeps its own keep-alive
+    connection on `local` and reuses it across requests.
+    """
+    http = getattr(local, "http", None)
+    if http is None:
+        http = AuthorizedHttp(credentials, http=httplib2.Http(timeout=timeout))
+        local.http = http
+    return http
@@ -1,23 +1,40 @@
 import os
-import io
+import time
+import asyncio
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait
 from dataclasses import dataclass
-from typing import List, Optional
+from functools import lru_cache, wraps
+from typing import Iterator, List, Optional, Tuple
 
 from langchain_core.tools import tool
-from googleapiclient.discovery import build
+from googleapiclient.discovery import build_from_document
+from googleapiclient.errors import HttpError
 from googleapiclient.http import MediaIoBaseDownload, MediaFileUpload
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
+from google_auth_httplib2 import AuthorizedHttp
+
+from .google_client import discovery_document, thread_http
 
 logger = logging.getLogger(__name__)
 
 # Google Drive API scopes
 SCOPES = ["https://www.googleapis.com/auth/drive"]
 
+# Drive accepts at most 100 calls in one batch request
+MAX_BATCH_REQUESTS = 100
+
+
+@lru_cache(maxsize=4)
+def _load_token_credentials(token_path: str, mtime_ns: int) -> Credentials:
+    """Credentials parsed from a token file; re-read only when the file's mtime changes."""
+    return Credentials.from_authorized_user_file(token_path, SCOPES)
 
-@dataclass
+
+@dataclass(slots=True)
 class DriveFile:
     """Represents a Google Drive file."""
     id: str
@@ -29,12 +46,45 @@ class DriveFile:
     web_view_link: Optional[str] = None
 
 
+def _to_drive_file(meta: dict) -> DriveFile:
+    """DriveFile from a Drive API file resource."""
+    get = meta.get
+    size = get("size")
+    return DriveFile(
+        get("id"),
+        get("name"),
+        get("mimeType"),
+        int(size) if size else None,
+        get("createdTime"),
+        get("modifiedTime"),
+        get("webViewLink"),
+    )
+
+
 class GoogleDriveService:
     """Google Drive API service wrapper."""
 
     def __init__(self) -> None:
         self.service = None
         self.credentials = None
+
+        # bulk transfers fan out over a worker pool, each worker with its own client
+        self.max_concurrency = int(os.getenv("GDRIVE_MAX_CONCURRENCY", "8"))
+        self._executor = ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix="gdrive")
+        self._local = threading.local()
+
+        # bytes fetched per download request; larger chunks mean fewer round-trips per file
+        self.download_chunk_size = int(os.getenv("GDRIVE_CHUNK_SIZE", str(8 * 1024 * 1024)))
+
+        # files up to this size go up in a single request, skipping the resumable session round-trip
+        self.resumable_threshold = int(os.getenv("GDRIVE_RESUMABLE_THRESHOLD", str(5 * 1024 * 1024)))
+        self.upload_chunk_size = int(os.getenv("GDRIVE_UPLOAD_CHUNK_SIZE", str(8 * 1024 * 1024)))
+
+        # concurrent uploads are spaced to stay under Drive's per-user write rate
+        self.max_writes_per_second = float(os.getenv("GDRIVE_MAX_WRITES_PER_SECOND", "10"))
+        self._write_lock = threading.Lock()
+        self._next_write_at = 0.0
+
         self._authenticate()
 
     def _authenticate(self) -> None:
@@ -49,8 +99,10 @@ class GoogleDriveService:
             token_path = os.getenv("GOOGLE_DRIVE_TOKEN_PATH", "drive_token.json")
             credentials_path = os.getenv("GOOGLE_DRIVE_CREDENTIALS_PATH", "credentials.json")
 
-            if os.path.exists(token_path):
-                creds = Credentials.from_authorized_user_file(token_path, SCOPES)
+            try:
+                creds = _load_token_credentials(token_path, os.stat(token_path).st_mtime_ns)
+            except FileNotFoundError:
+                pass
 
             if not creds or not creds.valid:
                 if creds and creds.expired and creds.refresh_token:
@@ -69,13 +121,25 @@ class GoogleDriveService:
                     token_file.write(creds.to_json())
 
             self.credentials = creds
-            self.service = build("drive", "v3", credentials=creds)
+            self.service = build_from_document(discovery_document("drive", "v3"), credentials=creds)
             logger.info("Google Drive service authenticated successfully")
 
         except Exception as e:
             logger.error("Failed to authenticate Google Drive: %s", e, exc_info=True)
             self.service = None
 
+    def _thread_http(self) -> AuthorizedHttp:
+        """Authorized HTTP client for the calling thread, shared by its Drive client and raw range requests"""
+        return thread_http(self._local, self.credentials)
+
+    def _thread_service(self):
+        """Drive client owned by the calling thread, on that thread's HTTP client"""
+        service = getattr(self._local, "service", None)
+        if service is None:
+            service = build_from_document(discovery_document("drive", "v3"), http=self._thread_http())
+            self._local.service = service
+        return service
+
     def list_files(self, query: Optional[str] = None, max_results: int = 10) -> List[DriveFile]:
         """List files in Google Drive.
 
@@ -99,26 +163,48 @@ class GoogleDriveService:
                 .execute()
             )
 
-            files_meta = results.get("files", [])
-            drive_files: List[DriveFile] = []
-            for meta in files_meta:
-                drive_files.append(
-                    DriveFile(
-                        id=meta.get("id"),
-                        name=meta.get("name"),
-                        mime_type=meta.get("mimeType"),
-                        size=int(meta["size"]) if meta.get("size") else None,
-                        created_time=meta.get("createdTime"),
-                        modified_time=meta.get("modifiedTime"),
-                        web_view_link=meta.get("webViewLink"),
-                    )
-                )
-            return drive_files
+            return [_to_drive_file(meta) for meta in results.get("files", [])]
 
         except Exception as e:
             logger.error("Failed to list Drive files: %s", e, exc_info=True)
             return []
 
+    def iter_files(self, query: Optional[str] = None, page_size: int = 1000) -> Iterator[DriveFile]:
+        """Iterate over every matching file in Google Drive, page by page.
+
+        The next page is requested on a pool worker while the caller consumes
+        the current one, overlapping each page's round-trip with processing.
+
+        Args:
+            query: Optional Drive query. Defaults to "trashed = false".
+            page_size: Files per page (Drive allows up to 1000).
+        """
+        if not self.service:
+            return
+
+        try:
+            files = self.service.files()
+            request = files.list(
+                q=query if query else "trashed = false",
+                pageSize=page_size,
+                fields="nextPageToken, files(id, name, mimeType, size, createdTime, modifiedTime, webViewLink)",
+            )
+            pending = self._executor.submit(self._execute_in_worker, request)
+            while pending is not None:
+                response = pending.result()
+                request = files.list_next(request, response)
+                pending = self._executor.submit(self._execute_in_worker, request) if request is not None else None
+
+                for meta in response.get("files", []):
+                    yield _to_drive_file(meta)
+
+        except Exception as e:
+            logger.error("Failed to list Drive files: %s", e, exc_info=True)
+
+    def _execute_in_worker(self, request):
+        """Pool task: execute an API request over the worker thread's own HTTP client."""
+        return request.execute(http=self._thread_http())
+
     def get_file_info(self, file_id: str) -> Optional[DriveFile]:
         """Get detailed information for a file by ID."""
         try:
@@ -134,37 +220,79 @@ class GoogleDriveService:
                 .execute()
             )
 
-            return DriveFile(
-                id=file.get("id"),
-                name=file.get("name"),
-                mime_type=file.get("mimeType"),
-                size=int(file["size"]) if file.get("size") else None,
-                created_time=file.get("createdTime"),
-                modified_time=file.get("modifiedTime"),
-                web_view_link=file.get("webViewLink"),
-            )
+            return _to_drive_file(file)
 
         except Exception as e:
             logger.error("Failed to get Drive file info: %s", e, exc_info=True)
             return None
 
+    def get_files_info(self, file_ids: List[str]) -> List[Optional[DriveFile]]:
+        """Get information for several files, batching up to 100 lookups per HTTP round-trip.
+
+        Returns:
+            One DriveFile per ID in input order, with None for files that could not be fetched.
+        """
+        results: List[Optional[DriveFile]] = [None] * len(file_ids)
+        if not self.service:
+            return results
+
+        def collect(request_id: str, file: dict, exception: Optional[Exception]) -> None:
+            if exception is not None:
+                logger.error("Failed to get Drive file info for %s: %s", file_ids[int(request_id)], exception)
+                return
+            results[int(request_id)] = _to_drive_file(file)
+
+        try:
+            for offset in range(0, len(file_ids), MAX_BATCH_REQUESTS):
+                batch = self.service.new_batch_http_request(callback=collect)
+                for index in range(offset, min(offset + MAX_BATCH_REQUESTS, len(file_ids))):
+                    batch.add(
+                        self.service.files().get(
+                            fileId=file_ids[index],
+                            fields="id, name, mimeType, size, createdTime, modifiedTime, webViewLink",
+                        ),
+                        request_id=str(index),
+                    )
+                batch.execute()
+
+        except Exception as e:
+            logger.error("Failed to get Drive files info: %s", e, exc_info=True)
+
+        return results
+
     def download_file(self, file_id: str, local_path: str) -> bool:
         """Download a file from Google Drive to a local path."""
+        if not self.service:
+            return False
+        return self._download(self.service, file_id, local_path)
+
+    async def adownload_file(self, file_id: str, local_path: str) -> bool:
+        """download_file for async callers, run on a worker thread with its own Drive client."""
+        if not self.service:
+            return False
+        return await asyncio.to_thread(self._download_in_worker, file_id, local_path)
+
+    def _download(self, service, file_id: str, local_path: str) -> bool:
+        """Download a file using the given Drive client."""
         try:
-            if not self.service:
-                return False
+            request = service.files().get_media(fileId=file_id)
 
-            request = self.service.files().get_media(fileId=file_id)
-            fh = io.BytesIO()
-            downloader = MediaIoBaseDownload(fh, request)
+            # chunks go straight to disk; the file only replaces local_path once complete
+            part_path = f"{local_path}.part"
+            try:
+                with open(part_path, "wb") as fh:
+                    downloader = MediaIoBaseDownload(fh, request, chunksize=self.download_chunk_size)
 
-            done = False
-            while not done:
-                status, done = downloader.next_chunk()
-                # Optional: log progress via status.progress()
+                    done = False
+                    while not done:
+                        status, done = downloader.next_chunk()
+                        # Optional: log progress via status.progress()
 
-            with open(local_path, "wb") as f:
-                f.write(fh.getvalue())
+                os.replace(part_path, local_path)
+            except BaseException:
+                if os.path.exists(part_path):
+                    os.remove(part_path)
+                raise
 
             logger.info("File downloaded successfully to %s", local_path)
             return True
@@ -185,10 +313,15 @@ class GoogleDriveService:
         Returns:
             The uploaded file's ID if successful, otherwise None.
         """
-        try:
-            if not self.service:
-                return None
+        if not self.service:
+            return None
+        return self._upload(self.service, local_path, drive_name, parent_folder_id)
 
+    def _upload(
+        self, service, local_path: str, drive_name: Optional[str] = None, parent_folder_id: Optional[str] = None
+    ) -> Optional[str]:
+        """Upload a local file using the given Drive client."""
+        try:
             if not os.path.exists(local_path):
                 logger.error("Local file not found for upload: %s", local_path)
                 return None
@@ -198,10 +331,11 @@ class GoogleDriveService:
             if parent_folder_id:
                 file_metadata["parents"] = [parent_folder_id]
 
-            media = MediaFileUpload(local_path, resumable=True)
+            resumable = os.path.getsize(local_path) > self.resumable_threshold
+            media = MediaFileUpload(local_path, resumable=resumable, chunksize=self.upload_chunk_size)
 
             file = (
-                self.service.files()
+                service.files()
                 .create(body=file_metadata, media_body=media, fields="id, webViewLink")
                 .execute()
             )
@@ -213,90 +347,229 @@ class GoogleDriveService:
             logger.error("Failed to upload file: %s", e, exc_info=True)
             return None
 
+    def download_file_sliced(self, file_id: str, local_path: str, slices: int = 8) -> bool:
+        """Download a large file as byte-range slices fetched in parallel.
+
+        Each slice is fetched on a pool worker in chunk-sized range requests and
+        written at its offset in a pre-sized file. Files no larger than one
+        download chunk, and Google-native files without a byte size, fall back
+        to download_file.
+        """
+        if not self.service:
+            return False
+
+        info = self.get_file_info(file_id)
+        if info is None or not info.size or info.size <= self.download_chunk_size:
+            return self.download_file(file_id, local_path)
 
-# Singleton service instance
-_drive_service = GoogleDriveService()
+        uri = self.service.files().get_media(fileId=file_id).uri
+        bounds = [info.size * i // slices for i in range(slices + 1)]
+        part_path = f"{local_path}.part"
+        futures = []
+        try:
+            with open(part_path, "wb") as fh:
+                fh.truncate(info.size)
+
+            futures = [
+                self._executor.submit(self._download_range, uri, part_path, start, end)
+                for start, end in zip(bounds, bounds[1:])
+                if end > start
+            ]
+            for future in as_completed(futures):
+                future.result()
+
+            os.replace(part_path, local_path)
+
+        except Exception as e:
+            logger.error("Failed to download file: %s", e, exc_info=True)
+            # Stop the remaining slices before removing the file they write into
+            for future in futures:
+                future.cancel()
+            wait(futures)
+            try:
+                os.remove(part_path)
+            except OSError:
+                pass
+            return False
+
+        logger.info("File downloaded successfully to %s", local_path)
+        return True
+
+    def _download_range(self, uri: str, part_path: str, start: int, end: int) -> None:
+        """Pool task: fetch bytes [start, end) of a media URI and write them in place."""
+        http = self._thread_http()
+        with open(part_path, "r+b") as fh:
+            offset = start
+            while offset < end:
+                last = min(offset + self.download_chunk_size, end) - 1
+                resp, content = http.request(uri, headers={"range": f"bytes={offset}-{last}"})
+                # anything but a partial response would put the wrong bytes at this offset
+                if resp.status != 206 or not content:
+                    raise HttpError(resp, content, uri=uri)
+
+                fh.seek(offset)
+                fh.write(content)
+                offset += len(content)
+
+    def _download_in_worker(self, file_id: str, local_path: str) -> bool:
+        """Pool task: download over the worker thread's own client."""
+        try:
+            service = self._thread_service()
+        except Exception as e:
+            logger.error("Failed to build Drive client: %s", e, exc_info=True)
+            return False
+        return self._download(service, file_id, local_path)
+
+    def _upload_in_worker(self, local_path: str, parent_folder_id: Optional[str]) -> Optional[str]:
+        """Pool task: upload over the worker thread's own client."""
+        try:
+            service = self._thread_service()
+        except Exception as e:
+            logger.error("Failed to build Drive client: %s", e, exc_info=True)
+            return None
+        self._throttle_write()
+        return self._upload(service, local_path, None, parent_folder_id)
+
+    def _throttle_write(self) -> None:
+        """Block until this worker's write may start, spacing writes at most max_writes_per_second apart."""
+        with self._write_lock:
+            now = time.monotonic()
+            start_at = max(now, self._next_write_at)
+            self._next_write_at = start_at + 1.0 / self.max_writes_per_second
+        if start_at > now:
+            time.sleep(start_at - now)
+
+    def bulk_download(self, items: List[Tuple[str, str]]) -> List[bool]:
+        """Download several files concurrently.
+
+        Args:
+            items: (file_id, local_path) pairs.
+        Returns:
+            One success flag per item, in input order.
+        """
+        if not self.service:
+            return [False] * len(items)
+
+        futures = {
+            self._executor.submit(self._download_in_worker, fid, path): index
+            for index, (fid, path) in enumerate(items)
+        }
+        results = [False] * len(items)
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+        return results
+
+    def upload_files(self, local_paths: List[str], parent_folder_id: Optional[str] = None) -> List[Optional[str]]:
+        """Upload several local files concurrently.
+
+        Args:
+            local_paths: Paths of the local files to upload, each keeping its base name in Drive.
+            parent_folder_id: Optional parent folder ID to upload into.
+        Returns:
+            The uploaded file IDs in input order, with None for failed uploads.
+        """
+        if not self.service:
+            return [None] * len(local_paths)
+
+        futures = {
+            self._executor.submit(self._upload_in_worker, path, parent_folder_id): index
+            for index, path in enumerate(local_paths)
+        }
+        results: List[Optional[str]] = [None] * len(local_paths)
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+        return results
+
+
+def _tool_safe(error_prefix: str):
+    """Decorate a tool so any exception is logged and returned as "<error_prefix>: <error>"."""
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            try:
+                return fn(*args, **kwargs)
+            except Exception as e:
+                logger.error("Error in %s tool: %s", fn.__name__, e, exc_info=True)
+                return f"{error_prefix}: {str(e)}"
+        return wrapper
+    return decorator
+
+
+@lru_cache(maxsize=1)
+def get_drive_service() -> GoogleDriveService:
+    """Process-wide Drive service. Importing the tools never starts OAuth; the first tool call does."""
+    return GoogleDriveService()
 
 
 @tool
+@_tool_safe("Failed to list Drive files")
 def list_drive_files(query: str = "", max_results: int = 10) -> str:
     """List files in Google Drive and return a human-readable summary string."""
-    try:
-        files = _drive_service.list_files(query or None, max_results)
-
-        if not files:
-            return "No files found in Google Drive."
-
-        result = f"Found {len(files)} files in Google Drive:\n\n"
-        for i, f in enumerate(files, 1):
-            size_info = f" ({f.size} bytes)" if f.size else ""
-            result += f"{i}. {f.name}{size_info}\n"
-            result += f"   ID: `{f.id}`\n"
-            result += f"   Type: {f.mime_type}\n"
-            if f.web_view_link:
-                result += f"   Link: {f.web_view_link}\n"
-            result += "\n"
-
-        return result
-    except Exception as e:
-        logger.error("Failed to list Drive files: %s", e, exc_info=True)
-        return f"Failed to list Drive files: {str(e)}"
+    files = get_drive_service().list_files(query or None, max_results)
+
+    if not files:
+        return "No files found in Google Drive."
+
+    lines = [f"Found {len(files)} files in Google Drive:", ""]
+    for i, f in enumerate(files, 1):
+        size_info = f" ({f.size} bytes)" if f.size else ""
+        lines.append(f"{i}. {f.name}{size_info}")
+        lines.append(f"   ID: `{f.id}`")
+        lines.append(f"   Type: {f.mime_type}")
+        if f.web_view_link:
+            lines.append(f"   Link: {f.web_view_link}")
+        lines.append("")
+
+    return "\n".join(lines) + "\n"
 
 @tool
+@_tool_safe("Error getting file info")
 def get_drive_file_info(file_id: str) -> str:
     """Get a formatted string with Drive file details."""
-    try:
-        f = _drive_service.get_file_info(file_id)
-        if not f:
-            return f"File not found with ID: {file_id}"
-
-        result = "**File Information:**\n\n"
-        result += f"**Name:** {f.name}\n"
-        result += f"**ID:** `{f.id}`\n"
-        result += f"**Type:** {f.mime_type}\n"
-        if f.size is not None:
-            result += f"**Size:** {f.size} bytes\n"
-        if f.created_time:
-            result += f"**Created:** {f.created_time}\n"
-        if f.modified_time:
-            result += f"**Modified:** {f.modified_time}\n"
-        if f.web_view_link:
-            result += f"**Link:** {f.web_view_link}\n"
-        return result
-
-    except Exception as e:
-        logger.error("Error in get_drive_file_info tool: %s", e, exc_info=True)
-        return f"Error getting file info: {str(e)}"
+    f = get_drive_service().get_file_info(file_id)
+    if not f:
+        return f"File not found with ID: {file_id}"
+
+    lines = [
+        "**File Information:**",
+        "",
+        f"**Name:** {f.name}",
+        f"**ID:** `{f.id}`",
+        f"**Type:** {f.mime_type}",
+    ]
+    if f.size is not None:
+        lines.append(f"**Size:** {f.size} bytes")
+    if f.created_time:
+        lines.append(f"**Created:** {f.created_time}")
+    if f.modified_time:
+        lines.append(f"**Modified:** {f.modified_time}")
+    if f.web_view_link:
+        lines.append(f"**Link:** {f.web_view_link}")
+    return "\n".join(lines) + "\n"
 
 @tool
+@_tool_safe("Error downloading file")
 def download_drive_file(file_id: str, local_path: str) -> str:
     """Download a Drive file to a local path and return a status message."""
-    try:
-        success = _drive_service.download_file(file_id, local_path)
-        if success:
-            return f"File downloaded successfully to: {local_path}"
-        else:
-            return f"Failed to download file with ID: {file_id}"
-    except Exception as e:
-        logger.error("Error in download_drive_file tool: %s", e, exc_info=True)
-        return f"Error downloading file: {str(e)}"
+    success = get_drive_service().download_file(file_id, local_path)
+    if success:
+        return f"File downloaded successfully to: {local_path}"
+    else:
+        return f"Failed to download file with ID: {file_id}"
 
 @tool
+@_tool_safe("Error uploading file")
 def upload_drive_file(local_path: str, drive_name: str = "", parent_folder_id: str = "") -> str:
     """Upload a local file to Google Drive and return a status message."""
-    try:
-        file_id = _drive_service.upload_file(
-            local_path,
-            drive_name if drive_name else None,
-            parent_folder_id if parent_folder_id else None,
-        )
-        if file_id:
-            return f"File uploaded successfully to Google Drive. File ID: `{file_id}`"
-        else:
-            return f"Failed to upload file: {local_path}"
-    except Exception as e:
-        logger.error("Error in upload_drive_file tool: %s", e, exc_info=True)
-        return f"Error uploading file: {str(e)}"
+    file_id = get_drive_service().upload_file(
+        local_path,
+        drive_name if drive_name else None,
+        parent_folder_id if parent_folder_id else None,
+    )
+    if file_id:
+        return f"File uploaded successfully to Google Drive. File ID: `{file_id}`"
+    else:
+        return f"Failed to upload file: {local_path}"
 
 
 GOOGLE_DRIVE_TOOLS = [
@@ -4,66 +4,50 @@ Manages user permissions and group access control
 """
 
 import os
-from typing import Set
+from typing import Dict, FrozenSet, Tuple
 from telegram import Update
 import logging
 
 logger = logging.getLogger(__name__)
 
+# (user id, chat id) decisions remembered per handler
+_DECISION_CACHE_SIZE = 4096
+
+
+def _parse_ids(env_var: str) -> FrozenSet[int]:
+    """Comma-separated Telegram ids from an environment variable; empty if unset or malformed"""
+    raw = os.getenv(env_var, "")
+    if not raw:
+        return frozenset()
+
+    try:
+        # int() accepts surrounding whitespace, so only blank entries need skipping
+        return frozenset(int(part) for part in raw.split(",") if part.strip())
+    except ValueError as e:
+        logger.error("Error parsing %s: %s", env_var, e)
+        return frozenset()
+
+
 class TelegramAuthHandler:
     """
     Handles authorization for Telegram bot interactions
     """
     def __init__(self):
-        self.authorized_groups = self._load_authorized_groups()
-        self.authorized_users = self._load_authorized_users()
-        self.admin_users = self._load_admin_users()
-
-        logger.info(f"Auth handler initialized with {len(self.authorized_groups)} groups, {len(self.authorized_users)} users")
+        self.authorized_groups = _parse_ids("TELEGRAM_ALLOWED_GROUPS")
+        self.authorized_users = _parse_ids("TELEGRAM_ALLOWED_USERS")
+        self.admin_users = _parse_ids("TELEGRAM_ADMIN_USERS")
 
-    def _load_authorized_groups(self) -> Set[int]:
-
-        group_env = os.getenv("TELEGRAM_ALLOWED_GROUPS", "")
-
-        if not group_env:
+        if not os.getenv("TELEGRAM_ALLOWED_GROUPS"):
             logger.warning("No TELEGRAM_ALLOWED_GROUPS specified - bot will work in all groups")
-            return set()
 
-        try:
-            group_ids = [int(group_id.strip()) for group_id in group_env.split(",") if group_id.strip()]
-            return set(group_ids)
-        except ValueError as e:
-            logger.error(f"Error parsing TELEGRAM_ALLOWED_GROUPS: {e}")
-            return set()
-
-    def _load_authorized_users(self) -> Set[int]:
-        
+        # the decision depends only on the two ids, so repeat messages skip the checks below
+        self._decisions: Dict[Tuple[int, int], bool] = {}
 
-        user_env = os.getenv("TELEGRAM_ALLOWED_USERS", "")
+        # read once: the environment is fixed for the life of the process
+        self._dev_mode = os.getenv("TELEGRAM_DEV_MODE", "false").lower() == "true"
+        self._open_access = not self.authorized_groups and not self.authorized_users
 
-        if not user_env:
-            return set()
-
-        try:
-            user_ids = [int(user_id.strip()) for user_id in user_env.split(",") if user_id.strip()]
-            return set(user_ids)
-        except ValueError as e:
-            logger.error(f"Error parsing TELEGRAM_ALLOWED_USERS: {e}")
-            return set()
-    
-    def _load_admin_users(self) -> Set[int]:
-
-        admins_env = os.getenv("TELEGRAM_ADMIN_USERS", "")
-        
-        if not admins_env:
-            return set()
-        
-        try:
-            admin_ids = [int(admin_id.strip()) for admin_id in admins_env.split(",") if admin_id.strip()]
-            return set(admin_ids)
-        except ValueError as e:
-            logger.error(f"Error parsing TELEGRAM_ADMIN_USERS: {e}")
-            return set()
+        logger.info("Auth handler initialized with %s groups, %s users", len(self.authorized_groups), len(self.authorized_users))
 
     def is_authorized(self, update: Update) -> bool:
 
@@ -73,44 +57,58 @@ class TelegramAuthHandler:
             
             if not user or not chat:
                 return False
-            
-            # admin users are always authorized
-            if user.id in self.admin_users:
-                logger.info(f"Admin user {user.first_name} ({user.id}) authorized")
-                return True
-            
-            # check if user is in authorized users list
-            if self.authorized_users and user.id in self.authorized_users:
-                logger.info(f"Authorized user {user.first_name} ({user.id}) granted access")
-                return True
-            
-            # explicit development mode check
-            dev_mode = os.getenv("TELEGRAM_DEV_MODE", "false").lower() == "true"
-
-            # check if chat is in authorized groups
-            if self.authorized_groups:
-                if chat.id in self.authorized_groups:
-                    logger.info(f"Message from authorized group {chat.title} ({chat.id})")
-                    return True
-                else:
-                    logger.warning(f"Unauthorized group access attempt: {chat.title} ({chat.id})")
-                    return False
-            
-            # if no specific authorization configured, allow all (development mode)
-            if dev_mode and not self.authorized_groups and not self.authorized_users:
-                logger.info(f"Development mode - allowing access from {user.first_name}")
-                return True
-            
-            elif not self.authorized_groups and not self.authorized_users:
-                logger.warning("No authorization configured and dev mode disabled - denying access")
-                return False
-            
-            logger.warning(f"Unauthorized access attempt from {user.first_name} ({user.id}) in {chat.title}")
+
+            key = (user.id, chat.id)
+            allowed = self._decisions.get(key)
+            if allowed is None:
+                allowed = self._decide(user, chat)
+                if len(self._decisions) >= _DECISION_CACHE_SIZE:
+                    # evict the oldest entry
+                    del self._decisions[next(iter(self._decisions))]
+                self._decisions[key] = allowed
+            if not allowed:
+                # audit every denied attempt, not only the first one per (user, chat)
+                self._log_denial(user, chat)
+            return allowed
+
+        except Exception as e:
+            logger.error("Error checking authorization : %s", e)
             return False
+
+    def _decide(self, user, chat) -> bool:
+        """Authorization decision for a user in a chat; grants are logged once per (user, chat) pair"""
+        # admin users are always authorized
+        if user.id in self.admin_users:
+            logger.info("Admin user %s (%s) authorized", user.first_name, user.id)
+            return True
         
-        except Exception as e:
-            logger.error(f"Error checking authorization : {e}")
+        # check if user is in authorized users list
+        if self.authorized_users and user.id in self.authorized_users:
+            logger.info("Authorized user %s (%s) granted access", user.first_name, user.id)
+            return True
+        
+        # check if chat is in authorized groups
+        if self.authorized_groups:
+            if chat.id in self.authorized_groups:
+                logger.info("Message from authorized group %s (%s)", chat.title, chat.id)
+                return True
             return False
+        
+        # if no specific authorization configured, allow all (development mode)
+        if self._dev_mode and self._open_access:
+            logger.info("Development mode - allowing access from %s", user.first_name)
+            return True
+        
+        return False
+
+    def _log_denial(self, user, chat) -> None:
+        """Warn about a denied request, matching the branch of _decide that denied it"""
+        if self.authorized_groups:
+            logger.warning("Unauthorized group access attempt: %s (%s)", chat.title, chat.id)
+        elif self._open_access:
+            logger.warning("No authorization configured and dev mode disabled - denying access")
+        else:
+            logger.warning("Unauthorized access attempt from %s (%s) in %s", user.first_name, user.id, chat.title)
 
     def is_admin(self, user_id: int) -> bool:
         return user_id in self.admin_users
@@ -118,21 +116,25 @@ class TelegramAuthHandler:
     def add_authorized_group(self, group_id: int) -> bool:
 
         try:
-            self.authorized_groups.add(group_id)
-            logger.info(f"Added group {group_id} to authorized list")
+            self.authorized_groups = self.authorized_groups | {group_id}
+            self._open_access = False
+            self._decisions.clear()
+            logger.info("Added group %s to authorized list", group_id)
             return True
         except Exception as e:
-            logger.error(f"Error adding authorized group: {e}")
+            logger.error("Error adding authorized group: %s", e)
             return False
     
     def remove_authorized_group(self, group_id: int) -> bool:
 
         try:
-            self.authorized_groups.discard(group_id)
-            logger.info(f"Removed group {group_id} from authorized list")
+            self.authorized_groups = self.authorized_groups - {group_id}
+            self._open_access = not self.authorized_groups and not self.authorized_users
+            self._decisions.clear()
+            logger.info("Removed group %s from authorized list", group_id)
             return True
         except Exception as e:
-            logger.error(f"Error removing authorized group: {e}")
+            logger.error("Error removing authorized group: %s", e)
             return False
     
     def get_auth_status(self) -> dict:
@@ -141,5 +143,5 @@ class TelegramAuthHandler:
             "authorized_groups": len(self.authorized_groups),
             "authorized_users": len(self.authorized_users),
             "admin_users": len(self.admin_users),
-            "development_mode": not self.authorized_groups and not self.authorized_users
+            "development_mode": self._open_access
         }
\ No newline at end of file
@@ -536,10 +536,7 @@ class HybridNativeAI:
             execution_desires = await self.execution_agent.update_desires(execution_beliefs, context)
             execution_intentions = await self.execution_agent.deliberate(execution_beliefs, execution_desires, [])
             
-            results = []
-            for intention in execution_intentions:
-                result = await self.execution_agent.act(intention, context)
-                results.append(result)
+            results = await self.execution_agent.act_all(execution_intentions, context)
             
             # Send results back to user
             if results:
@@ -1403,6 +1400,13 @@ class HybridNativeAI:
         # Handle all text messages
         self.application.add_handler(MessageHandler(filters.TEXT & ~filters.COMMAND, self.handle_message))
 
+        # Flush agent state once polling stops
+        self.application.post_shutdown = self.shutdown
+
+    async def shutdown(self, application: Application):
+        """Flush pending agent writes before the event loop closes"""
+        await self.execution_agent.aclose()
+
     async def run_async(self):
         """Run Telegram bot asynchronously"""
         await self.application.run_polling()
@@ -1435,6 +1439,9 @@ def setup_handlers(application, observer_agent, analyzer_agent, decision_agent,
     # Handle all text messages
     application.add_handler(MessageHandler(filters.TEXT & ~filters.COMMAND, bot.handle_message))
     
+    # Flush agent state once polling stops
+    application.post_shutdown = bot.shutdown
+    
     logger.info("Handlers setup complete")
     return bot
 
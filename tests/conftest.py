@@ -0,0 +1,13 @@
+"""
+Shared pytest setup for Native IQ tests
+Puts the project root and src/ on the import path
+"""
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+for p in [str(SRC), str(ROOT)]:
+    if p not in sys.path:
+        sys.path.insert(0, p)
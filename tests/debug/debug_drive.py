@@ -21,7 +21,8 @@ def test_drive_connection():
     
     # Test import
     try:
-        from domains.tools.google_drive_tool import _drive_service
+        from domains.tools.google_drive_tool import get_drive_service
+        _drive_service = get_drive_service()
         print("✅ Successfully imported Google Drive service")
     except Exception as e:
         print(f"❌ Failed to import Drive service: {e}")
@@ -86,16 +86,17 @@ for mod_path in drive_modules:
         mod = importlib.import_module(mod_path)
         print(f"✅ Successfully imported {mod_path}")
         
-        # Check for _drive_service
-        drive_service = getattr(mod, "_drive_service", None)
-        if drive_service:
-            print(f"  ✅ Found _drive_service")
+        # Check for get_drive_service
+        get_drive_service = getattr(mod, "get_drive_service", None)
+        if get_drive_service:
+            print(f"  ✅ Found get_drive_service")
+            drive_service = get_drive_service()
             if hasattr(drive_service, "list_files"):
-                print(f"  ✅ _drive_service has list_files method")
+                print(f"  ✅ Drive service has list_files method")
             else:
-                print(f"  ❌ _drive_service missing list_files method")
+                print(f"  ❌ Drive service missing list_files method")
         else:
-            print(f"  ❌ No _drive_service found")
+            print(f"  ❌ No get_drive_service found")
             
     except Exception as e:
         print(f"❌ Failed to import {mod_path}: {e}")
@@ -112,8 +112,14 @@ async def _download_drive_file_by_name(name: str) -> Path | None:
     if drive_mod is None:
         return None
 
-    # Use internal service to search by exact name
-    drive_service = getattr(drive_mod, "_drive_service", None)
+    # Use the shared service to search by exact name
+    get_drive_service = getattr(drive_mod, "get_drive_service", None)
+    if get_drive_service is None:
+        return None
+    try:
+        drive_service = get_drive_service()
+    except Exception:
+        return None
     if drive_service is None or not hasattr(drive_service, "list_files"):
         return None
     # Query for exact match (not trashed)
@@ -90,7 +90,7 @@ class ObserverAgentTest:
                 print(f"Context: {context}")
                 
                 # Test individual analysis methods
-                comm_belief = await observer._analyze_communication(message, context)
+                comm_belief = observer._analyze_communication(message, context)
                 if comm_belief:
                     print("Communication analysis successful")
                     print(f"  Tone: {comm_belief.content.get('tone')}")
@@ -123,7 +123,7 @@ class ObserverAgentTest:
             for i, message in enumerate(decision_messages):
                 print(f"\nAnalyzing decision message {i+1}: {message}")
                 
-                decision_belief = await observer._analyze_decision_patterns(message, {"message_type": "email"})
+                decision_belief = observer._analyze_decision_patterns(message, {"message_type": "email"})
                 if decision_belief:
                     decisions = decision_belief.content.get('decisions', [])
                     print(f"Found {len(decisions)} decisions:")
@@ -155,7 +155,7 @@ class ObserverAgentTest:
             for i, message in enumerate(automation_messages):
                 print(f"\nAnalyzing automation message {i+1}: {message}")
                 
-                automation_belief = await observer._identify_automation_opportunities(message, {"message_type": "email"})
+                automation_belief = observer._identify_automation_opportunities(message, {"message_type": "email"})
                 if automation_belief:
                     opportunities = automation_belief.content.get('opportunities', [])
                     print(f"Found {len(opportunities)} automation opportunities:")
@@ -186,7 +186,7 @@ class ObserverAgentTest:
             for i, message in enumerate(relationship_messages):
                 print(f"\nAnalyzing relationship message {i+1}: {message[:50]}...")
                 
-                relationship_belief = await observer._analyze_relationships(message, {"message_type": "email"})
+                relationship_belief = observer._analyze_relationships(message, {"message_type": "email"})
                 if relationship_belief:
                     contacts = relationship_belief.content.get('contacts_mentioned', [])
                     print(f"Found {len(contacts)} contacts: {contacts}")
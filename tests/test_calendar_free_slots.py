@@ -0,0 +1,186 @@
+"""
+Free-slot search tests for the Google Calendar tool
+Checks find_free_slots against a brute-force scan of the same slot grid
+"""
+
+import random
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.domains.tools import calandar_tool as cal
+
+
+MONDAY = datetime(2026, 10, 12, 7, 45, tzinfo=timezone.utc)
+FRIDAY = datetime(2026, 10, 16, 13, 5, tzinfo=timezone.utc)
+
+
+class FrozenDatetime(datetime):
+    """datetime whose now() is pinned by the test"""
+    frozen_now = MONDAY
+
+    @classmethod
+    def now(cls, tz=None):
+        return cls.frozen_now.astimezone(tz) if tz else cls.frozen_now
+
+
+class FakeRequest:
+    """Prepared API request answering with a canned body"""
+
+    def __init__(self, body):
+        self.body = body
+
+    def execute(self, http=None):
+        return self.body
+
+
+class FakeFreebusyService:
+    """Stands in for the Calendar API client"""
+
+    def __init__(self, busy_by_calendar):
+        self.busy_by_calendar = busy_by_calendar
+        self.queries = 0
+
+    def freebusy(self):
+        return self
+
+    def query(self, body):
+        self.queries += 1
+        return FakeRequest({
+            'calendars': {
+                item['id']: {'busy': self.busy_by_calendar.get(item['id'], [])}
+                for item in body['items']
+            }
+        })
+
+
+def _iso(value: datetime) -> str:
+    """Google-style UTC timestamp, keeping fractional seconds"""
+    return value.isoformat(timespec='milliseconds').replace('+00:00', 'Z')
+
+
+def _busy(start: datetime, end: datetime) -> dict:
+    return {'start': _iso(start), 'end': _iso(end)}
+
+
+def _parse(value: str) -> datetime:
+    return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+
+def brute_force_free_slots(service, now, busy_times, duration_minutes, days_ahead):
+    """First ten free slot starts, checking every candidate against every busy interval"""
+    intervals = [(_parse(busy['start']), _parse(busy['end'])) for busy in busy_times]
+    duration = timedelta(minutes=duration_minutes)
+    first_day_start = now.replace(hour=service.business_hours_start, minute=0, second=0, microsecond=0)
+
+    free = []
+    for day in range(days_ahead):
+        day_start = first_day_start + timedelta(days=day)
+        if day_start.weekday() >= 5:
+            continue
+        day_end = day_start + timedelta(hours=service.business_hours_end - service.business_hours_start)
+        slot_start = day_start
+        while slot_start + duration <= day_end:
+            slot_end = slot_start + duration
+            if not any(start < slot_end and slot_start < end for start, end in intervals):
+                free.append(slot_start)
+            slot_start += timedelta(minutes=30)
+    return free[:10]
+
+
+# Test fixtures
+@pytest.fixture
+def calendar_service(monkeypatch):
+    """GoogleCalendarService with no credentials, answered by FakeFreebusyService"""
+    monkeypatch.setattr(cal, "GOOGLE_AVAILABLE", False)
+    monkeypatch.setattr(cal, "datetime", FrozenDatetime)
+    monkeypatch.setattr(cal, "thread_http", lambda *args, **kwargs: None, raising=False)
+    return cal.GoogleCalendarService()
+
+
+async def _free_slot_starts(service, now, busy_by_calendar, duration_minutes, days_ahead, calendar_ids=None):
+    FrozenDatetime.frozen_now = now
+    service.service = FakeFreebusyService(busy_by_calendar)
+    slots = await service.find_free_slots(duration_minutes, days_ahead, calendar_ids)
+    for slot in slots:
+        assert slot.end_time - slot.start_time == timedelta(minutes=duration_minutes)
+        assert slot.duration_minutes == duration_minutes
+    return [slot.start_time for slot in slots]
+
+
+def _at(day: datetime, hour: int, minute: int = 0, second: float = 0.0) -> datetime:
+    return day.replace(hour=hour, minute=minute, second=0, microsecond=0) + timedelta(seconds=second)
+
+
+class TestFindFreeSlots:
+    """Test find_free_slots functionality"""
+
+    @pytest.mark.parametrize("busy", [
+        # overlapping
+        [_busy(_at(MONDAY, 9, 30), _at(MONDAY, 11)), _busy(_at(MONDAY, 10, 30), _at(MONDAY, 13))],
+        # nested
+        [_busy(_at(MONDAY, 9), _at(MONDAY, 17)), _busy(_at(MONDAY, 11), _at(MONDAY, 12))],
+        # touching
+        [_busy(_at(MONDAY, 9), _at(MONDAY, 10)), _busy(_at(MONDAY, 10), _at(MONDAY, 11, 30))],
+        # fractional seconds just inside and just outside slot bounds
+        [
+            _busy(_at(MONDAY, 8), _at(MONDAY, 9, second=0.5)),
+            _busy(_at(MONDAY, 10, second=-0.5), _at(MONDAY, 10, 15)),
+            _busy(_at(MONDAY, 12, second=0.25), _at(MONDAY, 12, 10)),
+            _busy(_at(MONDAY, 13, 59, 59.75), _at(MONDAY, 14, 0, 0.5)),
+        ],
+        [],
+    ], ids=["overlapping", "nested", "touching", "fractional", "empty"])
+    @pytest.mark.parametrize("duration_minutes", [30, 60, 90])
+    async def test_edge_cases(self, calendar_service, busy, duration_minutes):
+        """Test overlapping, nested, touching and sub-second busy intervals"""
+        found = await _free_slot_starts(calendar_service, MONDAY, {'primary': busy}, duration_minutes, 2)
+        assert found == brute_force_free_slots(calendar_service, MONDAY, busy, duration_minutes, 2)
+
+    async def test_weekend_days_are_skipped(self, calendar_service):
+        """Test no slots are offered on Saturday or Sunday"""
+        busy = [_busy(_at(FRIDAY, 9), _at(FRIDAY, 18))]  # Friday fully booked
+        found = await _free_slot_starts(calendar_service, FRIDAY, {'primary': busy}, 60, 4)
+        assert found == brute_force_free_slots(calendar_service, FRIDAY, busy, 60, 4)
+        assert found and all(start.weekday() < 5 for start in found)
+        assert found[0] == _at(FRIDAY + timedelta(days=3), 9)
+
+    async def test_busy_in_any_calendar_blocks_the_slot(self, calendar_service):
+        """Test busy time in any requested calendar blocks the slot"""
+        busy_by_calendar = {
+            'primary': [_busy(_at(MONDAY, 9), _at(MONDAY, 10))],
+            'team': [_busy(_at(MONDAY, 9, 30), _at(MONDAY, 11, 30))],
+        }
+        found = await _free_slot_starts(calendar_service, MONDAY, busy_by_calendar, 30, 1, ['primary', 'team'])
+        merged = busy_by_calendar['primary'] + busy_by_calendar['team']
+        assert found == brute_force_free_slots(calendar_service, MONDAY, merged, 30, 1)
+        assert found[0] == _at(MONDAY, 11, 30)
+
+    @pytest.mark.parametrize("seed", range(30))
+    async def test_random_schedules_match_brute_force(self, calendar_service, seed):
+        """Test random schedules against the brute-force scan"""
+        rng = random.Random(seed)
+        now = MONDAY + timedelta(days=rng.randint(0, 6), hours=rng.randint(0, 12))
+        days_ahead = rng.choice([1, 3, 7, 10])
+        busy = []
+        for _ in range(rng.randint(0, 60)):
+            start = _at(now, 8) + timedelta(
+                days=rng.randint(0, days_ahead),
+                minutes=rng.randint(0, 11 * 60),
+                seconds=rng.choice([0, 0, 0.5, 59.75]),
+            )
+            busy.append(_busy(start, start + timedelta(minutes=rng.choice([5, 15, 30, 60, 120, 300]))))
+        duration_minutes = rng.choice([15, 30, 45, 60, 120])
+
+        found = await _free_slot_starts(calendar_service, now, {'primary': busy}, duration_minutes, days_ahead)
+        assert found == brute_force_free_slots(calendar_service, now, busy, duration_minutes, days_ahead)
+
+    async def test_repeat_searches_reuse_the_freebusy_query(self, calendar_service):
+        """Test searches over the same window with different durations share one API round-trip"""
+        FrozenDatetime.frozen_now = MONDAY
+        calendar_service.service = FakeFreebusyService({'primary': [_busy(_at(MONDAY, 9), _at(MONDAY, 10))]})
+
+        for duration_minutes in (30, 60, 90):
+            await calendar_service.find_free_slots(duration_minutes, 3)
+
+        assert calendar_service.service.queries == 1
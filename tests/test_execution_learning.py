@@ -0,0 +1,88 @@
+"""
+Execution Agent Learning Tests
+Checks that learning from many knowledge beliefs at once matches learning from them one at a time
+"""
+
+import random
+
+import pytest
+
+from src.core.base_agent import Belief, BeliefType
+from src.domains.agents.execution.execution_agent import ExecutionAgent
+
+
+# Test fixtures
+@pytest.fixture
+def make_agent(tmp_path):
+    """Factory for fresh ExecutionAgents writing history under a temporary directory"""
+    def factory():
+        return ExecutionAgent(data_dir=tmp_path)
+    return factory
+
+
+def _knowledge(content, confidence=0.9, belief_type=BeliefType.KNOWLEDGE):
+    return Belief(type=belief_type, content=content, confidence=confidence, source="test")
+
+
+def _random_beliefs(rng: random.Random, count: int):
+    beliefs = []
+    for _ in range(count):
+        content = {}
+        if rng.random() < 0.7:
+            content["success_rate"] = rng.random()
+        if rng.random() < 0.6:
+            content["time_saved"] = rng.uniform(0, 30)
+        beliefs.append(_knowledge(content))
+    return beliefs
+
+
+async def _learn_one_by_one(agent, beliefs):
+    for belief in beliefs:
+        await agent.learn([belief], {})
+
+
+class TestExecutionLearning:
+    """Test ExecutionAgent.learn functionality"""
+
+    @pytest.mark.parametrize("count", [0, 1, 2, 63, 64, 500])
+    @pytest.mark.parametrize("seed", range(5))
+    async def test_batch_matches_one_by_one(self, make_agent, count, seed):
+        """Test accuracy and time saved are the same whether beliefs arrive together or separately"""
+        beliefs = _random_beliefs(random.Random(seed), count)
+        single, batch = make_agent(), make_agent()
+        single.accuracy_rate = batch.accuracy_rate = random.Random(-seed).random()
+
+        await _learn_one_by_one(single, beliefs)
+        await batch.learn(beliefs, {})
+
+        assert batch.accuracy_rate == pytest.approx(single.accuracy_rate, rel=1e-12, abs=1e-15)
+        assert batch.total_time_saved == pytest.approx(single.total_time_saved, rel=1e-12)
+
+    async def test_latest_feedback_weighs_most(self, make_agent):
+        """Test the most recent success rate carries the largest weight"""
+        agent = make_agent()
+        agent.accuracy_rate = 0.5
+        beliefs = [_knowledge({"success_rate": 0.0})] * 70 + [_knowledge({"success_rate": 1.0})]
+
+        await agent.learn(beliefs, {})
+
+        assert agent.accuracy_rate == pytest.approx(0.5 * 0.8 ** 71 + 0.2)
+
+    async def test_ignores_weak_and_non_knowledge_beliefs(self, make_agent):
+        """Test low-confidence and non-knowledge beliefs do not change what is learned"""
+        rng = random.Random(7)
+        beliefs = _random_beliefs(rng, 74)
+        noise = [
+            _knowledge({"success_rate": 0.0, "time_saved": 100.0}, confidence=0.5),
+            _knowledge({"success_rate": 0.0, "time_saved": 100.0}, belief_type=BeliefType.OBSERVATION),
+        ]
+        mixed = list(beliefs)
+        for belief in noise:
+            mixed.insert(rng.randint(0, len(mixed)), belief)
+
+        clean, learned = make_agent(), make_agent()
+        await clean.learn(beliefs, {})
+        await learned.learn(mixed, {})
+
+        assert learned.accuracy_rate == pytest.approx(clean.accuracy_rate, rel=1e-12)
+        assert learned.total_time_saved == pytest.approx(clean.total_time_saved, rel=1e-12)
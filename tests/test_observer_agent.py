@@ -0,0 +1,153 @@
+"""
+Observer Agent Tests
+Perception over message batches and the learned-intelligence summary
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from src.core.base_agent import Belief, BeliefType
+from src.domains.agents.observer.ob_agent import ObserverAgent
+
+
+# Test fixtures
+@pytest.fixture
+def observer():
+    """Create a fresh ObserverAgent"""
+    return ObserverAgent("observer_test")
+
+
+MESSAGES = [
+    "Hi John Smith, thanks for the update on the project budget.",
+    "URGENT: please approve the contract today",
+    "Dear team, please find attached the proposal. Regards",
+    "hey",
+    "Can we postpone the meeting? Same as last time works for me",
+    "Thanksgiving plans are urgently needed, hithere",
+    "Please find the enclosed invoice for $500 dated 12/01/2026",
+    "I disagree with the timeline, this is a problem",
+    "Great work, I'm happy to proceed",
+    "When is the client call?",
+    "ok",
+    "Emergency! The deal is cancelled, please confirm asap",
+]
+
+
+def _message(content):
+    """Minimal chat message; perceive only reads .content"""
+    return SimpleNamespace(content=content)
+
+
+def _comparable(beliefs):
+    """Belief payloads without the per-call ids and timestamps"""
+    comparable = []
+    for belief in beliefs:
+        content = dict(belief.content)
+        content.pop("timestamp", None)
+        comparable.append((belief.type, belief.source, belief.confidence, content))
+    return comparable
+
+
+class TestPerceive:
+    """Test ObserverAgent.perceive on batches"""
+
+    async def test_batch_matches_single_messages(self, observer):
+        """A batch large enough to be scanned in one pass yields the same beliefs as one message at a time"""
+        context = {"message_type": "email"}
+        batch_beliefs = await observer.perceive([_message(m) for m in MESSAGES], context)
+
+        single = ObserverAgent("observer_single")
+        single_beliefs = []
+        for message in MESSAGES:
+            single_beliefs.extend(await single.perceive([_message(message)], context))
+
+        assert _comparable(batch_beliefs) == _comparable(single_beliefs)
+
+    async def test_keywords_stay_with_their_message(self, observer):
+        """Keywords at the end of one message do not leak into the next"""
+        messages = ["thanks", "urgent"] + ["ok"] * 10
+        beliefs = await observer.perceive([_message(m) for m in messages], {})
+        comm = [b.content for b in beliefs if b.source == "communication_analyzer"]
+
+        assert comm[0]["tone"] == "casual" and comm[0]["urgency"] == "low"
+        assert comm[1]["tone"] == "neutral" and comm[1]["urgency"] == "high"
+        assert all(c["urgency"] == "low" for c in comm[2:])
+
+    async def test_partial_words_are_not_keywords(self, observer):
+        """Words that merely contain a keyword are ignored"""
+        messages = ["urgently", "thanksgiving", "hithere", "ahello"] * 3
+        beliefs = await observer.perceive([_message(m) for m in messages], {})
+
+        for belief in beliefs:
+            assert belief.content["tone"] == "neutral"
+            assert belief.content["urgency"] == "low"
+
+
+def _automation(*opportunities):
+    return Belief(
+        type=BeliefType.PATTERN,
+        content={"opportunities": [{"type": t, "automation_potential": p} for t, p in opportunities]},
+        source="automation_analyzer",
+    )
+
+
+def _decision(*decisions):
+    return Belief(
+        type=BeliefType.KNOWLEDGE,
+        content={"decisions": [{"decision": d} for d in decisions]},
+        source="decision_analyzer",
+    )
+
+
+def _communication(tone, message_type="email"):
+    return Belief(
+        type=BeliefType.OBSERVATION,
+        content={"tone": tone, "communication_type": message_type, "topics": []},
+        source="communication_analyzer",
+    )
+
+
+class TestIntelligenceSummary:
+    """Test ObserverAgent.get_intelligence_summary as patterns are learned and pruned"""
+
+    def _assert_summary_matches_patterns(self, observer):
+        summary = observer.get_intelligence_summary()
+        confidences = [pattern.confidence for pattern in observer.patterns.values()]
+
+        assert summary["patterns_learned"] == len(confidences)
+        assert summary["automation_opportunities"] == sum(c > 0.8 for c in confidences)
+        expected_mean = sum(confidences) / len(confidences) if confidences else 0.0
+        assert summary["learning_confidence"] == pytest.approx(expected_mean)
+        return summary
+
+    def test_empty_agent(self, observer):
+        """Test summary before anything is learned"""
+        summary = self._assert_summary_matches_patterns(observer)
+        assert summary["automation_opportunities"] == 0
+        assert summary["learning_confidence"] == 0.0
+
+    async def test_summary_tracks_added_updated_and_pruned_patterns(self, observer):
+        """Test counts and mean confidence stay in step with the patterns through every kind of change"""
+        rounds = [
+            # new low-confidence communication and decision patterns
+            [_communication("formal"), _communication("casual"), _decision("approve", "reject")],
+            # two strong automation patterns and one weak one, pruned on arrival
+            [_automation(("invoice", 0.9), ("digest", 0.95), ("reminder", 0.7))],
+            # invoice drops to 0.7 on its second sighting and is pruned from the middle of the table
+            [_automation(("invoice", 0.5))],
+            # repeated approvals push the decision pattern over the high-confidence threshold
+            [_decision("approve")] * 5,
+            # digest falls below the threshold and is pruned, leaving no automation patterns
+            [_automation(("digest", 0.0))],
+            # communication confidence climbs in small steps and caps at 0.95
+            [_communication("formal")] * 12,
+        ]
+        expected_high = [0, 2, 1, 2, 1, 2]
+
+        for beliefs, high in zip(rounds, expected_high):
+            await observer.learn(beliefs, [], {})
+            summary = self._assert_summary_matches_patterns(observer)
+            assert summary["automation_opportunities"] == high
+
+        assert not any(key.startswith("automation_") for key in observer.patterns)